@@ -65,11 +65,15 @@ def build_video_url_list(metadata: Dict, args: argparse.Namespace) -> List[str]:
             print(f"[skip] Skipping channel {channel.get('url')} (scan error: {channel.get('error')})")
             continue
 
-        videos = channel.get("videos", [])
+        # Version 2 metadata stores parallel arrays; version 1 used a list
+        # of {"video_id", "title"} dicts.
+        if "video_ids" in channel:
+            video_ids = channel.get("video_ids", [])
+        else:
+            video_ids = [v.get("video_id") for v in channel.get("videos", [])]
         channel_url = channel.get("url", "unknown")
 
-        for video in videos:
-            video_id = video.get("video_id")
+        for video_id in video_ids:
             if not video_id:
                 continue
 
@@ -4,9 +4,11 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
 import json
 import os
+import re
 import sys
 import urllib.parse
 from dataclasses import dataclass
@@ -14,6 +16,11 @@ from typing import Iterable, List, Optional, Sequence, Set, Tuple
 
 import youtube_dl as downloader
 
+try:  # Optional: faster JSON encoding for large source lists
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @dataclass
 class InterfaceConfig:
@@ -57,10 +64,16 @@ def _sanitized_remote_state_name(url: str) -> str:
     return f".channels_state_{safe}_{digest}.json"
 
 
+@functools.lru_cache(maxsize=128)
 def state_path_for_channels(
     channels_path: Optional[str], channels_url: Optional[str]
 ) -> str:
-    """Return the location used to remember previously seen sources."""
+    """Return the location used to remember previously seen sources.
+
+    Memoized: the refresh loop resolves the same state path on every scan,
+    so repeat calls skip the SHA-256 digest and path munging. The working
+    directory is effectively snapshotted on first call per input pair.
+    """
 
     if channels_url:
         filename = _sanitized_remote_state_name(channels_url)
@@ -87,7 +100,9 @@ def load_known_sources(path: str) -> List[str]:
         return []
 
     entries = data.get("sources", [])
-    return [str(item) for item in entries]
+    # Interned to share storage (and pointer-compare in set diffs) with the
+    # lines produced by the source loaders
+    return [sys.intern(str(item)) for item in entries]
 
 
 def save_known_sources(path: str, sources: Sequence[str]) -> None:
@@ -98,8 +113,21 @@ def save_known_sources(path: str, sources: Sequence[str]) -> None:
         os.makedirs(directory, exist_ok=True)
 
     payload = {"sources": list(sources)}
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+    # Serialize to one bytes blob and write it through a temp file in a
+    # single os.write, then atomically replace the old state file.
+    temp_path = f"{path}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(temp_path, path)
 
 
 def detect_new_sources(previous: Iterable[str], current: Iterable[str]) -> List[str]:
@@ -165,11 +193,31 @@ def _first_player_client(args: argparse.Namespace) -> Optional[str]:
     return downloader.DEFAULT_PLAYER_CLIENTS[0] if downloader.DEFAULT_PLAYER_CLIENTS else None
 
 
+_LOCAL_ID_RE = re.compile(r"\[([^\[\]]+)\]")
+
+
+def _collect_local_video_ids(output_root: Optional[str]) -> Set[str]:
+    """Collect every bracketed id-like token from filenames under *output_root*.
+
+    One directory walk with a precompiled regex; callers intersect the result
+    with the ids they actually care about, so false candidates are harmless.
+    """
+
+    candidates: Set[str] = set()
+    if not output_root or not os.path.isdir(output_root):
+        return candidates
+    for _dirpath, _dirnames, filenames in os.walk(output_root):
+        for filename in filenames:
+            candidates.update(_LOCAL_ID_RE.findall(filename))
+    return candidates
+
+
 def _scan_single_source(
     source: downloader.Source,
     args: argparse.Namespace,
     archive_ids: Set[str],
     player_client: Optional[str],
+    local_candidate_ids: Optional[Set[str]] = None,
 ) -> Optional[SourceStatus]:
     try:
         urls = source.build_download_urls(include_shorts=not args.no_shorts)
@@ -185,21 +233,9 @@ def _scan_single_source(
     video_ids = [entry.video_id for entry in video_entries]
     video_id_set = set(video_ids)
 
-    local_ids: Set[str] = set()
-    output_root = getattr(args, "output", None)
-    if output_root and os.path.isdir(output_root):
-        for _dirpath, _dirnames, filenames in os.walk(output_root):
-            for filename in filenames:
-                start = filename.find("[")
-                while start != -1:
-                    end = filename.find("]", start + 1)
-                    if end == -1:
-                        break
-                    candidate = filename[start + 1 : end]
-                    if candidate in video_id_set:
-                        local_ids.add(candidate)
-                        break
-                    start = filename.find("[", end + 1)
+    if local_candidate_ids is None:
+        local_candidate_ids = _collect_local_video_ids(getattr(args, "output", None))
+    local_ids = local_candidate_ids & video_id_set
 
     known_ids = archive_ids | local_ids
     downloaded_ids = known_ids & video_id_set
@@ -252,11 +288,17 @@ def perform_scan(config: InterfaceConfig, *, update_state: bool) -> Optional[Sca
     archive_ids = downloader._load_download_archive(config.args.archive)
     player_client = _first_player_client(config.args)
 
+    # Walk the output tree once for the whole scan; each source then
+    # intersects the shared candidate set instead of re-walking the tree.
+    local_candidate_ids = _collect_local_video_ids(getattr(config.args, "output", None))
+
     total_sources = len(sources)
     statuses: List[SourceStatus] = []
     for idx, source in enumerate(sources, start=1):
         print(f"[scan {idx}/{total_sources}] Checking {source.url}")
-        status = _scan_single_source(source, config.args, archive_ids, player_client)
+        status = _scan_single_source(
+            source, config.args, archive_ids, player_client, local_candidate_ids
+        )
         if status:
             print(
                 "    -> "
@@ -267,10 +267,18 @@ def populate_queue_from_metadata(metadata_path: str, queue: DownloadQueue, archi
             continue
 
         channel_url = channel.get("url", "unknown")
-        videos = channel.get("videos", [])
 
-        for video in videos:
-            video_id = video.get("video_id")
+        # Version 2 metadata stores parallel arrays; version 1 used a list
+        # of {"video_id", "title"} dicts.
+        if "video_ids" in channel:
+            video_ids = channel.get("video_ids", [])
+            titles = channel.get("titles", [])
+        else:
+            legacy_videos = channel.get("videos", [])
+            video_ids = [v.get("video_id") for v in legacy_videos]
+            titles = [v.get("title") for v in legacy_videos]
+
+        for index, video_id in enumerate(video_ids):
             if not video_id:
                 continue
 
@@ -283,7 +291,7 @@ def populate_queue_from_metadata(metadata_path: str, queue: DownloadQueue, archi
             queued_video = QueuedVideo(
                 video_id=video_id,
                 video_url=f"https://www.youtube.com/watch?v={video_id}",
-                title=video.get("title"),
+                title=titles[index] if index < len(titles) else None,
                 channel_url=channel_url,
                 status=VideoStatus.PENDING,
             )
@@ -41,39 +41,198 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import json
+import logging
 import os
-import shutil
 import sys
+import threading
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import youtube_dl as downloader
 
+try:  # Optional: ~5-10x faster JSON encoding for large caches
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # Optional: streaming JSON parse keeps resume memory at one channel
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors that make an existing metadata file unusable for resume
+_METADATA_LOAD_ERRORS = (ValueError, KeyError, OSError) + (
+    (ijson.JSONError,) if ijson is not None else ()
+)
+
+# The same URLs are normalized repeatedly (load, dedup, per-source display);
+# memoize the pure function once for the whole module.
+_normalize_url = functools.lru_cache(maxsize=4096)(downloader.normalize_url)
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_download_urls(source: downloader.Source, include_shorts: bool) -> Tuple[str, ...]:
+    """Memoized build_download_urls; Source is frozen, so it hashes by value."""
+    return tuple(source.build_download_urls(include_shorts=include_shorts))
+
+
+logger = logging.getLogger("scan_channels")
+
+
+def _configure_logging() -> None:
+    """Set up the stdout log handler with the [HH:MM:SS] prefix."""
+    # Line-buffer stdout once so redirected output still appears per line
+    # without forcing a write(2) syscall from every print call.
+    try:
+        sys.stdout.reconfigure(line_buffering=True)
+    except (AttributeError, ValueError):
+        pass  # Not a regular TextIOWrapper (tests may substitute stdout)
+    logging.basicConfig(
+        format="[%(asctime)s] %(message)s",
+        datefmt="%H:%M:%S",
+        level=logging.INFO,
+        stream=sys.stdout,
+    )
+
 
 def _log_with_timestamp(message: str) -> None:
     """Print a log message with timestamp."""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] {message}")
-    sys.stdout.flush()  # Force immediate output
+    logger.info(message)
+
 
+def _log_block(lines: List[str]) -> None:
+    """Emit several log lines as one record (single write and flush)."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n".join(lines))
 
-@dataclass
+
+@dataclass(frozen=True)
+class ScanConfig:
+    """Immutable per-scan settings threaded through the scan loop.
+
+    Keeps the shared ``argparse.Namespace`` untouched so per-source overrides
+    (like the request interval) never leak between sources.
+    """
+
+    request_interval: float
+    include_shorts: bool
+    player_client: Optional[str]
+    checkpoint_every: int = 0
+    checkpoint_every_minutes: float = 0.0
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace, player_client: Optional[str]) -> "ScanConfig":
+        """Build a config snapshot from parsed command-line arguments."""
+        return cls(
+            request_interval=args.request_interval,
+            include_shorts=not args.no_shorts,
+            player_client=player_client,
+            checkpoint_every=getattr(args, "checkpoint_every", 0),
+            checkpoint_every_minutes=getattr(args, "checkpoint_every_minutes", 0.0),
+        )
+
+
+class AdaptiveInterval:
+    """AIMD controller for the inter-source request interval.
+
+    A fixed --request-interval is either slower than necessary or trips
+    YouTube's rate limiting. Grow the interval multiplicatively whenever a
+    source scan hits rate-limit errors, and decay it gently back toward the
+    configured base after a run of clean scans.
+    """
+
+    BACKOFF_FACTOR = 1.5
+    RECOVERY_FACTOR = 0.95
+    SUCCESSES_BEFORE_RECOVERY = 3
+    MAX_MULTIPLIER = 8.0
+
+    def __init__(self, base_interval: float) -> None:
+        self.base_interval = base_interval
+        self.current = base_interval
+        self._clean_streak = 0
+
+    def record_rate_limited(self) -> None:
+        """Back off multiplicatively after a rate-limited source scan."""
+        previous = self.current
+        self.current = min(
+            self.current * self.BACKOFF_FACTOR,
+            self.base_interval * self.MAX_MULTIPLIER,
+        )
+        self._clean_streak = 0
+        if self.current != previous:
+            _log_with_timestamp(
+                f"[adaptive] ⚠ Rate limiting detected - increasing request interval: "
+                f"{previous:.1f}s → {self.current:.1f}s"
+            )
+
+    def record_success(self) -> None:
+        """Decay back toward the base interval after a run of clean scans."""
+        self._clean_streak += 1
+        if self._clean_streak < self.SUCCESSES_BEFORE_RECOVERY:
+            return
+        if self.current > self.base_interval:
+            previous = self.current
+            self.current = max(self.base_interval, self.current * self.RECOVERY_FACTOR)
+            _log_with_timestamp(
+                f"[adaptive] ✓ {self._clean_streak} clean scans - easing request interval: "
+                f"{previous:.1f}s → {self.current:.1f}s"
+            )
+
+
+# Schema version written to metadata.json. Version 2 stores videos as
+# parallel arrays (video_ids + titles) instead of a list of per-video dicts.
+METADATA_SCHEMA_VERSION = 2
+
+
+@dataclass(slots=True)
 class ChannelMetadata:
-    """Metadata for a single channel/source."""
+    """Metadata for a single channel/source.
+
+    Videos are stored as parallel arrays (struct-of-arrays): a 2-key dict per
+    video costs ~240 bytes of overhead, so for channels with thousands of
+    entries the dicts dwarfed the actual strings.
+    """
 
     url: str
     kind: str
     label: str
     scan_timestamp: str
-    videos: List[Dict[str, Optional[str]]]
+    video_ids: List[str]
+    titles: List[Optional[str]]
     total_videos: int
     error: Optional[str] = None
-
-
-@dataclass
+    # Hash of the scan settings that produced this entry (see _scan_key);
+    # None on entries written before keys existed.
+    scan_key: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        """Plain-dict form for JSON encoding.
+
+        Unlike dataclasses.asdict this shares the video lists instead of
+        deep-copying them, which matters when a channel holds tens of
+        thousands of entries.
+        """
+        return {
+            "url": self.url,
+            "kind": self.kind,
+            "label": self.label,
+            "scan_timestamp": self.scan_timestamp,
+            "video_ids": self.video_ids,
+            "titles": self.titles,
+            "total_videos": self.total_videos,
+            "error": self.error,
+            "scan_key": self.scan_key,
+        }
+
+
+@dataclass(slots=True)
 class MetadataCache:
     """Container for all scanned metadata."""
 
@@ -81,49 +240,222 @@ class MetadataCache:
     channels: List[ChannelMetadata]
     total_videos: int
     total_channels: int
+    # Collected in the same pass as the totals so summary printing doesn't
+    # re-walk the full channel list; not serialized (see to_dict).
+    failed_channels: List[ChannelMetadata] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        """Plain-dict form for JSON encoding (no deep copies)."""
+        return {
+            "version": METADATA_SCHEMA_VERSION,
+            "scan_date": self.scan_date,
+            "total_channels": self.total_channels,
+            "total_videos": self.total_videos,
+            "channels": [ch.to_dict() for ch in self.channels],
+        }
+
+
+def _channel_from_dict(ch_data: Dict) -> ChannelMetadata:
+    """Rebuild a ChannelMetadata from its JSON dict form.
+
+    Accepts both the current parallel-array layout and the version-1
+    per-video dict list so old metadata files still resume cleanly.
+    """
+    if "video_ids" in ch_data:
+        video_ids = ch_data["video_ids"]
+        titles = ch_data["titles"]
+    else:
+        legacy_videos = ch_data["videos"]
+        video_ids = [v["video_id"] for v in legacy_videos]
+        titles = [v.get("title") for v in legacy_videos]
+    return ChannelMetadata(
+        url=ch_data["url"],
+        # kind has a handful of possible values ("channel", "playlist", ...);
+        # interning collapses the thousands of copies a big resume load creates.
+        kind=sys.intern(ch_data["kind"]),
+        label=ch_data["label"],
+        scan_timestamp=ch_data["scan_timestamp"],
+        video_ids=video_ids,
+        titles=titles,
+        total_videos=ch_data["total_videos"],
+        error=ch_data.get("error"),
+        scan_key=ch_data.get("scan_key"),
+    )
+
+
+def _scan_key(url: str, include_shorts: bool, player_client: Optional[str]) -> str:
+    """Short settings hash keying the resume cache.
+
+    Deduping on the URL alone keeps stale entries around when the scan
+    settings change (e.g. yesterday's --no-shorts scan silently shadows
+    today's full one); hashing the settings in forces a rescan instead.
+    """
+    material = f"{url}|{include_shorts}|{player_client or ''}"
+    return hashlib.blake2b(material.encode("utf-8"), digest_size=12).hexdigest()
+
 
+def _journal_path(output_path: str) -> str:
+    """Path of the append-only JSONL journal next to the metadata file."""
+    return output_path + ".jsonl"
 
-def load_existing_metadata(output_path: str) -> Optional[MetadataCache]:
-    """Load existing metadata cache from JSON file if it exists."""
-    if not os.path.exists(output_path):
-        return None
 
+def append_channel_line(output_path: str, channel: ChannelMetadata) -> None:
+    """Append one scanned channel to the JSONL journal.
+
+    This is an O(1) crash-safe record of each completed source; the journal
+    is replayed on resume if the consolidated metadata.json write was
+    interrupted, and truncated once a full save succeeds.
+    """
+    journal = _journal_path(output_path)
     try:
-        with open(output_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Convert dict data back to ChannelMetadata objects
-        channels = []
-        for ch_data in data.get("channels", []):
-            channels.append(
-                ChannelMetadata(
-                    url=ch_data["url"],
-                    kind=ch_data["kind"],
-                    label=ch_data["label"],
-                    scan_timestamp=ch_data["scan_timestamp"],
-                    videos=ch_data["videos"],
-                    total_videos=ch_data["total_videos"],
-                    error=ch_data.get("error"),
-                )
-            )
+        if orjson is not None:
+            line = orjson.dumps(channel.to_dict()) + b"\n"
+        else:
+            line = (json.dumps(channel.to_dict(), ensure_ascii=False) + "\n").encode("utf-8")
+        with open(journal, "ab") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+    except OSError as exc:
+        _log_with_timestamp(f"[save] ⚠ Warning: Could not append to journal {journal}: {exc}")
 
+
+def _load_journal_channels(output_path: str) -> List[ChannelMetadata]:
+    """Load channels recorded in the JSONL journal, skipping torn lines."""
+    journal = _journal_path(output_path)
+    if not os.path.exists(journal):
+        return []
+
+    channels: List[ChannelMetadata] = []
+    try:
+        with open(journal, "r", encoding="utf-8") as f:
+            for line in f:
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                try:
+                    channels.append(_channel_from_dict(json.loads(stripped)))
+                except (json.JSONDecodeError, KeyError):
+                    # A torn write at the tail (crash mid-append) is expected;
+                    # skip anything unparsable.
+                    continue
+    except OSError as exc:
+        _log_with_timestamp(f"[resume] ⚠ Warning: Could not read journal {journal}: {exc}")
+        return []
+    return channels
+
+
+def _safe_normalize(url: str) -> str:
+    """Normalize a URL for dedup, falling back to the raw string when invalid."""
+    try:
+        return _normalize_url(url)
+    except ValueError:
+        return url
+
+
+def _read_metadata_file(output_path: str) -> MetadataCache:
+    """Parse a metadata JSON file into a MetadataCache.
+
+    With ijson installed, channels are streamed one object at a time so peak
+    memory stays at one channel instead of the whole materialized dict tree;
+    otherwise falls back to a plain json.load.
+    """
+    if ijson is not None:
+        scan_date: Optional[str] = None
+        total_videos: Optional[int] = None
+        total_channels: Optional[int] = None
+        channels: List[ChannelMetadata] = []
+        builder = None
+
+        with open(output_path, "rb") as f:
+            for prefix, event, value in ijson.parse(f):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == "channels.item" and event == "end_map":
+                        channels.append(_channel_from_dict(builder.value))
+                        builder = None
+                elif prefix == "channels.item" and event == "start_map":
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix == "scan_date":
+                    scan_date = value
+                elif prefix == "total_videos":
+                    total_videos = int(value)
+                elif prefix == "total_channels":
+                    total_channels = int(value)
+
+        if scan_date is None:
+            raise KeyError("scan_date")
         return MetadataCache(
-            scan_date=data["scan_date"],
+            scan_date=scan_date,
             channels=channels,
-            total_videos=data["total_videos"],
-            total_channels=data["total_channels"],
+            total_videos=total_videos if total_videos is not None else sum(
+                ch.total_videos for ch in channels
+            ),
+            total_channels=total_channels if total_channels is not None else len(channels),
         )
-    except (json.JSONDecodeError, KeyError, OSError) as exc:
-        _log_with_timestamp(f"[resume] ⚠ Warning: Could not load existing metadata from {output_path}: {exc}")
-        _log_with_timestamp(f"[resume] Will start fresh scan")
-        return None
+
+    with open(output_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    channels = [_channel_from_dict(ch_data) for ch_data in data.get("channels", [])]
+    return MetadataCache(
+        scan_date=data["scan_date"],
+        channels=channels,
+        total_videos=data["total_videos"],
+        total_channels=data["total_channels"],
+    )
+
+
+def load_existing_metadata(output_path: str) -> Tuple[Optional[MetadataCache], frozenset]:
+    """Load existing metadata cache from JSON file, replaying the journal.
+
+    Returns the cache (or None) together with the frozenset of normalized
+    channel URLs, built in the same pass so callers don't re-normalize.
+    """
+    cache: Optional[MetadataCache] = None
+
+    if os.path.exists(output_path):
+        try:
+            cache = _read_metadata_file(output_path)
+        except _METADATA_LOAD_ERRORS as exc:
+            _log_with_timestamp(f"[resume] ⚠ Warning: Could not load existing metadata from {output_path}: {exc}")
+            _log_with_timestamp(f"[resume] Will try the journal before starting fresh")
+
+    # Replay journal entries that never made it into a consolidated save
+    journal_channels = _load_journal_channels(output_path)
+    if journal_channels:
+        known_urls = {ch.url for ch in cache.channels} if cache else set()
+        recovered = [ch for ch in journal_channels if ch.url not in known_urls]
+        if recovered:
+            _log_with_timestamp(
+                f"[resume] ♻ Recovered {len(recovered)} channel(s) from journal {_journal_path(output_path)}"
+            )
+            if cache:
+                cache.channels.extend(recovered)
+                cache.total_videos += sum(ch.total_videos for ch in recovered)
+                cache.total_channels = len(cache.channels)
+            else:
+                cache = MetadataCache(
+                    scan_date=datetime.now().isoformat(),
+                    channels=recovered,
+                    total_videos=sum(ch.total_videos for ch in recovered),
+                    total_channels=len(recovered),
+                )
+
+    if cache is None:
+        return None, frozenset()
+    # Keyed entries are matched on their settings hash; entries written
+    # before scan keys existed fall back to the normalized URL.
+    return cache, frozenset(
+        ch.scan_key or _safe_normalize(ch.url) for ch in cache.channels
+    )
 
 
 def scan_single_source(
     source: downloader.Source,
     args: argparse.Namespace,
-    player_client: Optional[str],
-    request_interval: float,
+    config: ScanConfig,
     error_analyzer: Optional[downloader.ErrorAnalyzer] = None,
     checkpoint_callback: Optional[callable] = None,
 ) -> ChannelMetadata:
@@ -131,9 +463,8 @@ def scan_single_source(
 
     Args:
         source: The YouTube source to scan
-        args: Command-line arguments
-        player_client: YouTube player client to use
-        request_interval: Seconds to wait between requests
+        args: Command-line arguments (read-only; never mutated here)
+        config: Immutable per-scan settings (interval, client, checkpointing)
         error_analyzer: Optional error analyzer for tracking failures
         checkpoint_callback: Optional callback(partial_metadata, is_final) for progress saving
 
@@ -144,10 +475,21 @@ def scan_single_source(
     _log_with_timestamp(f"[source] ▶ Starting scan of source: {source.url}")
     _log_with_timestamp(f"[source] Source type: {source.kind.value}")
 
+    request_interval = config.request_interval
+    player_client = config.player_client
+
+    # Freeze a private copy of the namespace up front so nothing in this
+    # function can touch the caller's args (concurrent workers share it).
+    scan_args = argparse.Namespace(**vars(args))
+    scan_args.sleep_requests = request_interval
+
+    # One timestamp per scan; every return path stamps the same moment
+    scan_timestamp = datetime.now().isoformat()
+
     # Check if checkpointing is enabled
     checkpoint_enabled = checkpoint_callback is not None
-    checkpoint_every = getattr(args, 'checkpoint_every', 0)
-    checkpoint_minutes = getattr(args, 'checkpoint_every_minutes', 0.0)
+    checkpoint_every = config.checkpoint_every
+    checkpoint_minutes = config.checkpoint_every_minutes
 
     if checkpoint_enabled and (checkpoint_every > 0 or checkpoint_minutes > 0):
         _log_with_timestamp(f"[checkpoint] Auto-checkpointing enabled:")
@@ -158,8 +500,8 @@ def scan_single_source(
 
     try:
         _log_with_timestamp(f"[source] Building URLs to scan...")
-        urls = source.build_download_urls(include_shorts=not args.no_shorts)
-        display_url = downloader.normalize_url(source.url)
+        urls = _build_download_urls(source, config.include_shorts)
+        display_url = _normalize_url(source.url)
 
         url_list = list(urls)
         _log_with_timestamp(f"[source] Built {len(url_list)} URL(s) to scan:")
@@ -175,43 +517,41 @@ def scan_single_source(
             url=source.url,
             kind=source.kind.value,
             label=source.url,
-            scan_timestamp=datetime.now().isoformat(),
-            videos=[],
+            scan_timestamp=scan_timestamp,
+            video_ids=[],
+            titles=[],
             total_videos=0,
             error=str(exc),
+            scan_key=_scan_key(source.url, config.include_shorts, player_client),
         )
 
     _log_with_timestamp(f"[source] Starting video metadata extraction...")
     _log_with_timestamp(f"[source] Rate limiting: {request_interval}s between requests")
 
-    # Override sleep_requests to use the configured interval
-    args.sleep_requests = request_interval
-
     try:
         # Collect videos from all URLs (this handles multiple URLs like /videos and /shorts)
         video_entries = downloader.collect_all_video_ids(
-            urls, args, player_client, error_analyzer=error_analyzer
+            urls, scan_args, player_client, error_analyzer=error_analyzer
         )
 
-        # Convert VideoMetadata objects to dicts
-        videos = [
-            {"video_id": entry.video_id, "title": entry.title}
-            for entry in video_entries
-        ]
+        # Struct-of-arrays: two flat lists instead of a dict per video
+        video_ids = [entry.video_id for entry in video_entries]
+        titles = [entry.title for entry in video_entries]
 
         label = downloader.summarize_source_label(source, display_url)
 
         _log_with_timestamp(f"[source] ✓ Scan complete!")
         _log_with_timestamp(f"[source] Summary for {display_url}:")
-        _log_with_timestamp(f"[source]   • Total videos found: {len(videos)}")
+        _log_with_timestamp(f"[source]   • Total videos found: {len(video_ids)}")
         _log_with_timestamp(f"[source]   • Source label: {label}")
 
-        # Show a sample of video titles if we have any
-        if videos:
-            sample_size = min(3, len(videos))
+        # Show a sample of video titles if we have any (skip the string
+        # slicing entirely when INFO output is muted)
+        if titles and logger.isEnabledFor(logging.INFO):
+            sample_size = min(3, len(titles))
             _log_with_timestamp(f"[source]   • Sample videos:")
-            for i, video in enumerate(videos[:sample_size], 1):
-                title = video['title'] or '(no title)'
+            for i, title in enumerate(titles[:sample_size], 1):
+                title = title or '(no title)'
                 title_short = title[:60] + '...' if len(title) > 60 else title
                 _log_with_timestamp(f"[source]     {i}. {title_short}")
 
@@ -219,9 +559,11 @@ def scan_single_source(
             url=display_url,
             kind=source.kind.value,
             label=label,
-            scan_timestamp=datetime.now().isoformat(),
-            videos=videos,
-            total_videos=len(videos),
+            scan_timestamp=scan_timestamp,
+            video_ids=video_ids,
+            titles=titles,
+            total_videos=len(video_ids),
+            scan_key=_scan_key(display_url, config.include_shorts, player_client),
         )
 
         # Call checkpoint callback with final results if enabled
@@ -238,10 +580,12 @@ def scan_single_source(
             url=display_url,
             kind=source.kind.value,
             label=display_url,
-            scan_timestamp=datetime.now().isoformat(),
-            videos=[],
+            scan_timestamp=scan_timestamp,
+            video_ids=[],
+            titles=[],
             total_videos=0,
             error=str(exc),
+            scan_key=_scan_key(display_url, config.include_shorts, player_client),
         )
 
         # Call checkpoint callback even on error to save partial progress
@@ -251,6 +595,124 @@ def scan_single_source(
         return error_metadata
 
 
+class _TokenBucket:
+    """Thread-safe rate limiter that spaces acquisitions by a fixed interval.
+
+    Concurrent workers each block in acquire() until their slot, so the
+    aggregate request rate stays at one source per interval no matter how
+    many workers run.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._next_slot - now)
+            self._next_slot = now + wait + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class _ErrorCollector:
+    """Picklable stand-in for ErrorAnalyzer inside process-pool workers.
+
+    ErrorAnalyzer holds an open error-log path and would race on it across
+    processes, so workers just record the raw (video_id, message) calls and
+    the parent replays them into the real analyzer.
+    """
+
+    def __init__(self) -> None:
+        self.errors: List[Tuple[Optional[str], str]] = []
+
+    def categorize_and_record(self, video_id: Optional[str], error_message: str) -> str:
+        self.errors.append((video_id, error_message))
+        return "unknown"
+
+
+def _scan_source_in_process(
+    source: downloader.Source,
+    args: argparse.Namespace,
+    config: "ScanConfig",
+) -> Tuple[ChannelMetadata, List[Tuple[Optional[str], str]]]:
+    """Process-pool entry point: scan one source and return its errors too."""
+    collector = _ErrorCollector()
+    metadata = scan_single_source(source, args, config, collector)
+    return metadata, collector.errors
+
+
+async def _scan_sources_async(
+    sources: List[downloader.Source],
+    args: argparse.Namespace,
+    config: "ScanConfig",
+    error_analyzer: downloader.ErrorAnalyzer,
+    on_result: callable,
+    concurrency: int,
+    process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None,
+) -> None:
+    """Scan sources concurrently under a semaphore plus a shared token bucket.
+
+    scan_single_source is blocking (yt-dlp HTTP calls), so each worker runs
+    it in a thread via asyncio.to_thread; the token bucket keeps the
+    aggregate request rate at one source start per request_interval. With a
+    process_pool the blocking call runs in a child process instead, so the
+    extractor's JSON/regex work no longer serializes on the GIL.
+    """
+
+    sem = asyncio.Semaphore(concurrency)
+    bucket = _TokenBucket(config.request_interval)
+    total = len(sources)
+    loop = asyncio.get_running_loop()
+
+    async def worker(idx: int, source: downloader.Source) -> None:
+        async with sem:
+            await asyncio.to_thread(bucket.acquire)
+            _log_with_timestamp(f"[scan {idx}/{total}] Scanning {source.url}")
+            if process_pool is not None:
+                metadata, errors = await loop.run_in_executor(
+                    process_pool, _scan_source_in_process, source, args, config
+                )
+                for video_id, message in errors:
+                    error_analyzer.categorize_and_record(video_id, message)
+            else:
+                metadata = await asyncio.to_thread(
+                    scan_single_source, source, args, config, error_analyzer
+                )
+            on_result(idx, metadata)
+
+    await asyncio.gather(*(worker(idx, source) for idx, source in enumerate(sources, 1)))
+
+
+def _already_scanned(
+    source: downloader.Source, config: "ScanConfig", existing_keys: frozenset
+) -> bool:
+    """Whether the resume cache already covers this source under config.
+
+    Matches the settings hash a scan would produce now, falling back to the
+    normalized URL for cache entries written before scan keys existed.
+    """
+    normalized = _safe_normalize(source.url)
+    key = _scan_key(normalized, config.include_shorts, config.player_client)
+    return key in existing_keys or normalized in existing_keys
+
+
+def _merge_channels(
+    existing: List[ChannelMetadata], new: List[ChannelMetadata]
+) -> List[ChannelMetadata]:
+    """Merge channel lists, deduping by normalized URL (newest wins).
+
+    A plain list concat would append duplicates whenever a source gets
+    rescanned, bloating the cache across resume cycles.
+    """
+    merged = {_safe_normalize(ch.url): ch for ch in existing}
+    for ch in new:
+        merged[_safe_normalize(ch.url)] = ch
+    return list(merged.values())
+
+
 def scan_all_channels(
     args: argparse.Namespace,
     request_interval: float,
@@ -260,8 +722,10 @@ def scan_all_channels(
     # Initialize error analyzer
     error_analyzer = downloader.ErrorAnalyzer()
 
-    # Set up error log path
+    # Set up error log path; make the output directory once here rather than
+    # stat+mkdir on every incremental save
     output_dir = os.path.dirname(args.output) if os.path.dirname(args.output) else "."
+    os.makedirs(output_dir, exist_ok=True)
     error_log_path = os.path.join(output_dir, "scan_errors.log")
     error_analyzer.set_error_log_path(error_log_path)
 
@@ -269,24 +733,17 @@ def scan_all_channels(
 
     # Load existing metadata for resume capability (unless --force is used)
     existing_metadata: Optional[MetadataCache] = None
-    existing_urls: Set[str] = set()
+    existing_urls: frozenset = frozenset()
 
     if not args.force:
         _log_with_timestamp(f"[resume] Checking for existing metadata in {args.output}...")
-        existing_metadata = load_existing_metadata(args.output)
+        existing_metadata, existing_urls = load_existing_metadata(args.output)
 
         if existing_metadata:
             _log_with_timestamp(f"[resume] ✓ Loaded existing metadata:")
             _log_with_timestamp(f"[resume]   • Previously scanned: {existing_metadata.total_channels} channel(s)")
             _log_with_timestamp(f"[resume]   • Total videos in cache: {existing_metadata.total_videos}")
             _log_with_timestamp(f"[resume]   • Last scan date: {existing_metadata.scan_date}")
-
-            # Build set of already-scanned URLs (normalized)
-            for ch in existing_metadata.channels:
-                # Normalize URL for comparison
-                normalized = downloader.normalize_url(ch.url)
-                existing_urls.add(normalized)
-
             _log_with_timestamp(f"[resume] Resume mode: Will skip already-scanned sources")
         else:
             _log_with_timestamp(f"[resume] No existing metadata found - starting fresh scan")
@@ -324,7 +781,6 @@ def scan_all_channels(
         print(f"Using automatic client rotation ({len(downloader.DEFAULT_PLAYER_CLIENTS)} clients available: {', '.join(downloader.DEFAULT_PLAYER_CLIENTS)})")
 
     # Scan each source
-    total_sources = len(sources)
     new_channel_metadata: List[ChannelMetadata] = []
     new_videos = 0
     skipped_count = 0
@@ -335,8 +791,14 @@ def scan_all_channels(
     session_start_time = time.time()
     last_checkpoint_time = session_start_time
 
+    # Build the immutable per-scan config once
+    config = ScanConfig.from_args(args, player_client)
+
+    # AIMD controller: back off on rate limiting, recover after clean scans
+    adaptive = AdaptiveInterval(request_interval)
+
     # Get checkpoint configuration
-    checkpoint_every_minutes = getattr(args, 'checkpoint_every_minutes', 10.0)
+    checkpoint_every_minutes = config.checkpoint_every_minutes
     time_checkpoint_enabled = checkpoint_every_minutes > 0
 
     # Define checkpoint callback for per-source saving
@@ -350,33 +812,111 @@ def scan_all_channels(
         # This will be called when the source completes
         # The actual saving happens after we append to new_channel_metadata
 
-    for idx, source in enumerate(sources, start=1):
-        _log_with_timestamp(f"\n{'='*50}")
-        _log_with_timestamp(f"[scan {idx}/{total_sources}] Scanning {source.url}")
-        _log_with_timestamp(f"{'='*50}")
+    def build_snapshot() -> MetadataCache:
+        """Combine existing and newly scanned channels into a cache snapshot."""
+        if existing_metadata:
+            channels = _merge_channels(existing_metadata.channels, new_channel_metadata)
+        else:
+            channels = list(new_channel_metadata)
+        return MetadataCache(
+            scan_date=datetime.now().isoformat(),
+            channels=channels,
+            total_videos=sum(ch.total_videos for ch in channels),
+            total_channels=len(channels),
+        )
+
+    scan_concurrency = getattr(args, "scan_concurrency", 1) or 1
+    if scan_concurrency > 1 and len(sources) > 1:
+        # Concurrent path: overlap the per-source waits instead of sleeping
+        # serially. The token bucket preserves the aggregate request budget.
+        pending_sources: List[downloader.Source] = []
+        for source in sources:
+            if _already_scanned(source, config, existing_urls):
+                skipped_count += 1
+                continue
+            pending_sources.append(source)
+
+        _log_with_timestamp(
+            f"[scan] Concurrent scan: {len(pending_sources)} source(s) with "
+            f"{scan_concurrency} workers ({skipped_count} skipped, already scanned)"
+        )
 
-        # Check if this source was already scanned
+        def on_result(idx: int, metadata: ChannelMetadata) -> None:
+            nonlocal new_videos, successful_scans, failed_scans
+            new_channel_metadata.append(metadata)
+            append_channel_line(args.output, metadata)
+            if not metadata.error:
+                new_videos += metadata.total_videos
+                successful_scans += 1
+            else:
+                failed_scans += 1
+            _log_with_timestamp(
+                f"[scan] Progress: {len(new_channel_metadata)}/{len(pending_sources)} sources "
+                f"({successful_scans} successful, {failed_scans} failed), {new_videos} new videos"
+            )
+            try:
+                save_metadata(build_snapshot(), args.output, create_backup=True)
+            except OSError as exc:
+                _log_with_timestamp(f"[save] ⚠ Warning: Save failed: {exc}")
+
+        process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        if getattr(args, "scan_processes", False):
+            process_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(scan_concurrency, os.cpu_count() or 1)
+            )
         try:
-            normalized_url = downloader.normalize_url(source.url)
-        except ValueError:
-            # Invalid URL, will be handled by scan_single_source
-            normalized_url = source.url
-
-        if normalized_url in existing_urls:
-            _log_with_timestamp(f"[resume] ⏭ Skipping - already scanned")
-            _log_with_timestamp(f"[resume] (Use --force to rescan all sources)")
+            asyncio.run(
+                _scan_sources_async(
+                    pending_sources,
+                    args,
+                    config,
+                    error_analyzer,
+                    on_result,
+                    scan_concurrency,
+                    process_pool=process_pool,
+                )
+            )
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown()
+        sources = []  # Already handled; the serial loop below has nothing left to do
+
+    # Partition the work up front so the hot loop has no skip branch
+    to_scan: List[downloader.Source] = []
+    for source in sources:
+        if _already_scanned(source, config, existing_urls):
             skipped_count += 1
-            continue
+        else:
+            to_scan.append(source)
+    if skipped_count and sources:
+        _log_with_timestamp(
+            f"[resume] ⏭ Skipping {skipped_count} already-scanned source(s) "
+            f"(use --force to rescan all sources)"
+        )
+    total_to_scan = len(to_scan)
+    snapshot_every = max(1, getattr(args, "snapshot_every", 1) or 1)
+
+    for idx, source in enumerate(to_scan, start=1):
+        _log_with_timestamp(f"\n{'='*50}")
+        _log_with_timestamp(f"[scan {idx}/{total_to_scan}] Scanning {source.url}")
+        _log_with_timestamp(f"{'='*50}")
 
         scan_start = time.time()
+        scan_start_monotonic = time.monotonic()
+        rate_limit_errors_before = error_analyzer.patterns["rate_limit"].count
         metadata = scan_single_source(
-            source, args, player_client, request_interval, error_analyzer,
-            checkpoint_callback=checkpoint_callback
+            source, args, replace(config, request_interval=adaptive.current),
+            error_analyzer, checkpoint_callback=checkpoint_callback
         )
+        if error_analyzer.patterns["rate_limit"].count > rate_limit_errors_before:
+            adaptive.record_rate_limited()
+        elif not metadata.error:
+            adaptive.record_success()
         scan_duration = time.time() - scan_start
-        _log_with_timestamp(f"[scan {idx}/{total_sources}] Completed in {scan_duration:.1f} seconds")
+        _log_with_timestamp(f"[scan {idx}/{total_to_scan}] Completed in {scan_duration:.1f} seconds")
 
         new_channel_metadata.append(metadata)
+        append_channel_line(args.output, metadata)
 
         # Update statistics
         if not metadata.error:
@@ -385,74 +925,87 @@ def scan_all_channels(
         else:
             failed_scans += 1
 
-        # INCREMENTAL SAVE - Save progress after each source
+        # INCREMENTAL SAVE - Save a full snapshot every --snapshot-every
+        # sources (the journal already records each source as it finishes,
+        # so a crash between snapshots loses nothing).
         # Also check for time-based checkpoint
         current_time = time.time()
         time_since_checkpoint = current_time - last_checkpoint_time
         should_save_time_based = time_checkpoint_enabled and time_since_checkpoint >= (checkpoint_every_minutes * 60)
+        snapshot_due = (
+            len(new_channel_metadata) % snapshot_every == 0 or idx == total_to_scan
+        )
 
         if should_save_time_based:
             _log_with_timestamp(f"\n[checkpoint] ⏰ Time-based checkpoint triggered ({time_since_checkpoint/60:.1f} minutes elapsed)")
-        else:
-            _log_with_timestamp(f"\n[save] 💾 Saving progress after source completion...")
-
-        # Combine existing and new data for incremental save
-        if existing_metadata:
-            current_cache = MetadataCache(
-                scan_date=datetime.now().isoformat(),
-                channels=existing_metadata.channels + new_channel_metadata,
-                total_videos=existing_metadata.total_videos + new_videos,
-                total_channels=len(existing_metadata.channels) + len(new_channel_metadata),
-            )
-        else:
-            current_cache = MetadataCache(
-                scan_date=datetime.now().isoformat(),
-                channels=new_channel_metadata,
-                total_videos=new_videos,
-                total_channels=len(new_channel_metadata),
-            )
+        elif snapshot_due:
+            _log_with_timestamp(f"\n[save] 💾 Saving progress snapshot...")
 
-        # Save with backup
-        try:
-            save_metadata(current_cache, args.output, create_backup=True)
-            last_checkpoint_time = current_time  # Update checkpoint time on successful save
-        except OSError as exc:
-            _log_with_timestamp(f"[save] ⚠ Warning: Save failed: {exc}")
-            _log_with_timestamp(f"[save] Continuing scan... (will retry after next source)")
+        if should_save_time_based or snapshot_due:
+            # Combine existing and new data for incremental save
+            current_cache = build_snapshot()
 
-        # Display real-time statistics
-        _log_with_timestamp(f"\n[stats] === SESSION STATISTICS ===")
-        _log_with_timestamp(f"[stats] Session progress: {idx - skipped_count}/{total_sources - skipped_count} sources scanned")
-        _log_with_timestamp(f"[stats] Already cached: {skipped_count} sources")
-        _log_with_timestamp(f"[stats] New scans: {len(new_channel_metadata)} sources ({successful_scans} successful, {failed_scans} failed)")
-        _log_with_timestamp(f"[stats] New videos found: {new_videos}")
+            # Save with backup
+            try:
+                save_metadata(current_cache, args.output, create_backup=True)
+                last_checkpoint_time = current_time  # Update checkpoint time on successful save
+            except OSError as exc:
+                _log_with_timestamp(f"[save] ⚠ Warning: Save failed: {exc}")
+                _log_with_timestamp(f"[save] Continuing scan... (will retry after next source)")
 
         # Calculate totals including existing data
         total_channels_now = (len(existing_metadata.channels) if existing_metadata else 0) + len(new_channel_metadata)
         total_videos_now = (existing_metadata.total_videos if existing_metadata else 0) + new_videos
-        _log_with_timestamp(f"[stats] Total in cache: {total_channels_now} channels, {total_videos_now} videos")
 
         # Time statistics
         session_elapsed = time.time() - session_start_time
         avg_time_per_source = session_elapsed / (len(new_channel_metadata)) if new_channel_metadata else 0
-        remaining_sources = total_sources - idx - skipped_count
+        remaining_sources = total_to_scan - idx
         estimated_time_remaining = avg_time_per_source * remaining_sources if remaining_sources > 0 else 0
 
-        _log_with_timestamp(f"[stats] Session time: {session_elapsed/60:.1f} minutes")
+        # Display real-time statistics in a single write rather than line-by-line
+        stats_lines = [
+            "",
+            "[stats] === SESSION STATISTICS ===",
+            f"[stats] Session progress: {idx}/{total_to_scan} sources scanned",
+            f"[stats] Already cached: {skipped_count} sources",
+            f"[stats] New scans: {len(new_channel_metadata)} sources ({successful_scans} successful, {failed_scans} failed)",
+            f"[stats] New videos found: {new_videos}",
+            f"[stats] Total in cache: {total_channels_now} channels, {total_videos_now} videos",
+            f"[stats] Session time: {session_elapsed/60:.1f} minutes",
+        ]
         if remaining_sources > 0:
-            _log_with_timestamp(f"[stats] Avg time per source: {avg_time_per_source/60:.1f} minutes")
-            _log_with_timestamp(f"[stats] Estimated time remaining: {estimated_time_remaining/60:.1f} minutes")
             estimated_completion = datetime.fromtimestamp(time.time() + estimated_time_remaining)
-            _log_with_timestamp(f"[stats] Estimated completion: {estimated_completion.strftime('%Y-%m-%d %H:%M:%S')}")
-        _log_with_timestamp(f"[stats] ========================\n")
-
-        # Sleep between sources to avoid rate limiting (except after the last one)
+            stats_lines.extend([
+                f"[stats] Avg time per source: {avg_time_per_source/60:.1f} minutes",
+                f"[stats] Estimated time remaining: {estimated_time_remaining/60:.1f} minutes",
+                f"[stats] Estimated completion: {estimated_completion.strftime('%Y-%m-%d %H:%M:%S')}",
+            ])
+        stats_lines.append("[stats] ========================")
+        stats_lines.append("")
+        _log_block(stats_lines)
+
+        # Pace source starts to one per interval (except after the last one).
+        # Sleeping toward a deadline counts the scan itself against the
+        # interval, so the cadence is `interval`, not `scan + interval`.
         if remaining_sources > 0:
-            _log_with_timestamp(f"[scan] Waiting {request_interval}s before next source...")
-            next_start_time = datetime.now().timestamp() + request_interval
-            _log_with_timestamp(f"[scan] Next scan will start at approximately {datetime.fromtimestamp(next_start_time).strftime('%H:%M:%S')}")
-            time.sleep(request_interval)
-            _log_with_timestamp(f"[scan] Wait complete, moving to next source...")
+            # Warm the URL-build cache for the next source before sleeping so
+            # its construction (and any normalization error) is off the
+            # post-wait critical path.
+            try:
+                _build_download_urls(to_scan[idx], config.include_shorts)
+            except ValueError:
+                pass  # scan_single_source reports it properly next iteration
+            deadline = scan_start_monotonic + adaptive.current
+            wait = deadline - time.monotonic()
+            if wait > 0:
+                _log_with_timestamp(f"[scan] Waiting {wait:.1f}s before next source...")
+                next_start = time.strftime("%H:%M:%S", time.localtime(time.time() + wait))
+                _log_with_timestamp(f"[scan] Next scan will start at approximately {next_start}")
+                time.sleep(wait)
+                _log_with_timestamp(f"[scan] Wait complete, moving to next source...")
+            else:
+                _log_with_timestamp(f"[scan] Scan outlasted the request interval; continuing immediately")
 
     # Merge with existing metadata if resuming
     if existing_metadata:
@@ -461,9 +1014,15 @@ def scan_all_channels(
         _log_with_timestamp(f"[resume]   • Newly scanned: {len(new_channel_metadata)}")
         _log_with_timestamp(f"[resume]   • Skipped (already scanned): {skipped_count}")
 
-        # Combine old and new channels
-        all_channels = existing_metadata.channels + new_channel_metadata
-        combined_total_videos = existing_metadata.total_videos + new_videos
+        # Combine old and new channels, deduping by normalized URL; totals
+        # and the failed list come out of the same pass
+        all_channels = _merge_channels(existing_metadata.channels, new_channel_metadata)
+        combined_total_videos = 0
+        failed_channels: List[ChannelMetadata] = []
+        for ch in all_channels:
+            combined_total_videos += ch.total_videos
+            if ch.error:
+                failed_channels.append(ch)
 
         _log_with_timestamp(f"[resume]   • Total channels in output: {len(all_channels)}")
         _log_with_timestamp(f"[resume]   • Total videos in output: {combined_total_videos}")
@@ -474,6 +1033,7 @@ def scan_all_channels(
                 channels=all_channels,
                 total_videos=combined_total_videos,
                 total_channels=len(all_channels),
+                failed_channels=failed_channels,
             ),
             error_analyzer,
         )
@@ -485,11 +1045,33 @@ def scan_all_channels(
                 channels=new_channel_metadata,
                 total_videos=new_videos,
                 total_channels=len(new_channel_metadata),
+                failed_channels=[ch for ch in new_channel_metadata if ch.error],
             ),
             error_analyzer,
         )
 
 
+# Signature of the last file written per output path. When only scan_date
+# would change, re-serialising the whole cache is skipped entirely.
+_LAST_SAVED_SIGNATURES: Dict[str, str] = {}
+
+
+def _cache_signature(cache: MetadataCache) -> str:
+    """Cheap content signature for a cache (ignores the volatile scan_date).
+
+    Each channel's content is fully determined by its URL and scan timestamp,
+    so hashing those (plus counts) detects changes without re-encoding every
+    video entry.
+    """
+    hasher = hashlib.sha1()
+    for ch in cache.channels:
+        hasher.update(
+            f"{ch.url}\t{ch.scan_timestamp}\t{ch.total_videos}\t{ch.error}\n".encode("utf-8")
+        )
+    hasher.update(f"{cache.total_channels}\t{cache.total_videos}".encode("utf-8"))
+    return hasher.hexdigest()
+
+
 def save_metadata(cache: MetadataCache, output_path: str, create_backup: bool = True) -> None:
     """Save metadata cache to JSON file with optional backup.
 
@@ -499,48 +1081,52 @@ def save_metadata(cache: MetadataCache, output_path: str, create_backup: bool =
         create_backup: If True, create a backup of existing file before overwriting
     """
 
+    # Skip the rewrite entirely when nothing but scan_date would change
+    signature = _cache_signature(cache)
+    if _LAST_SAVED_SIGNATURES.get(output_path) == signature and os.path.exists(output_path):
+        os.utime(output_path, None)
+        _log_with_timestamp(f"[save] ⏭ Metadata unchanged - skipping rewrite of {output_path}")
+        return
+
     # Convert to dict
-    data = {
-        "scan_date": cache.scan_date,
-        "total_channels": cache.total_channels,
-        "total_videos": cache.total_videos,
-        "channels": [
-            {
-                "url": ch.url,
-                "kind": ch.kind,
-                "label": ch.label,
-                "scan_timestamp": ch.scan_timestamp,
-                "total_videos": ch.total_videos,
-                "videos": ch.videos,
-                "error": ch.error,
-            }
-            for ch in cache.channels
-        ],
-    }
-
-    # Ensure directory exists
-    directory = os.path.dirname(output_path)
-    if directory:
-        os.makedirs(directory, exist_ok=True)
-
-    # Create backup of existing file before overwriting
-    if create_backup and os.path.exists(output_path):
-        backup_path = f"{output_path}.backup"
-        try:
-            shutil.copy2(output_path, backup_path)
-            _log_with_timestamp(f"[save] Created backup: {backup_path}")
-        except OSError as exc:
-            _log_with_timestamp(f"[save] ⚠ Warning: Could not create backup: {exc}")
+    data = cache.to_dict()
 
-    # Write to temporary file first, then rename (atomic operation)
+    # Write to temporary file first, then rename (atomic operation).
+    # The output directory is created once at scan start, not per save.
     temp_path = f"{output_path}.tmp"
     try:
-        with open(temp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            payload = orjson.dumps(data)
+        else:
+            payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        with open(temp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Rotate the previous generation aside with a rename (no full copy);
+        # only done once the new payload is durable on disk.
+        if create_backup and os.path.exists(output_path):
+            backup_path = f"{output_path}.backup"
+            try:
+                os.replace(output_path, backup_path)
+                _log_with_timestamp(f"[save] Rotated previous metadata to {backup_path}")
+            except OSError as exc:
+                _log_with_timestamp(f"[save] ⚠ Warning: Could not create backup: {exc}")
 
         # Atomic rename (prevents corruption if interrupted)
         os.replace(temp_path, output_path)
+        _LAST_SAVED_SIGNATURES[output_path] = signature
         _log_with_timestamp(f"[save] ✓ Metadata saved to {output_path}")
+
+        # The consolidated file now covers everything; reset the journal
+        journal = _journal_path(output_path)
+        if os.path.exists(journal):
+            try:
+                with open(journal, "w", encoding="utf-8"):
+                    pass
+            except OSError:
+                pass
     except OSError as exc:
         _log_with_timestamp(f"[save] ❌ Error saving metadata: {exc}")
         # Clean up temp file if it exists
@@ -552,8 +1138,9 @@ def save_metadata(cache: MetadataCache, output_path: str, create_backup: bool =
         raise
 
 
-def parse_args(argv=None) -> argparse.Namespace:
-    """Parse command-line arguments."""
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; repeated parse_args calls reuse it."""
 
     parser = argparse.ArgumentParser(
         description="Scan YouTube channels for video metadata (slowly to avoid rate limiting)."
@@ -586,6 +1173,38 @@ def parse_args(argv=None) -> argparse.Namespace:
         help="Seconds to wait between metadata requests (default: 60.0 - one per minute)",
     )
 
+    parser.add_argument(
+        "--scan-concurrency",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Scan up to N sources concurrently. The aggregate request rate is "
+            "still limited to one source start per --request-interval (default: 1)"
+        ),
+    )
+
+    parser.add_argument(
+        "--snapshot-every",
+        type=int,
+        default=1,
+        metavar="K",
+        help=(
+            "Rewrite the full metadata snapshot every K completed sources "
+            "(default: 1). The per-source journal still records every result, "
+            "so higher values only amortize the JSON encode, not durability"
+        ),
+    )
+
+    parser.add_argument(
+        "--scan-processes",
+        action="store_true",
+        help=(
+            "With --scan-concurrency > 1, run each scan in a worker process "
+            "instead of a thread so extractor parsing uses multiple cores"
+        ),
+    )
+
     # Resume control
     parser.add_argument(
         "--force",
@@ -635,7 +1254,7 @@ def parse_args(argv=None) -> argparse.Namespace:
     )
     parser.add_argument(
         "--youtube-fetch-po-token",
-        choices=["auto", "always", "never"],
+        choices=("auto", "always", "never"),
         default=None,
         help="Control PO token fetching behaviour",
     )
@@ -693,6 +1312,39 @@ def parse_args(argv=None) -> argparse.Namespace:
         help="Path to a file containing proxy URLs (one per line). Proxies will be rotated randomly.",
     )
 
+    return parser
+
+
+# Filled in only when apply_authentication_defaults left them unset
+# (callables are factories, so each parse gets its own mutable value)
+_SCAN_SOFT_DEFAULTS = {
+    "bgutil_provider": "disabled",
+    "bgutil_provider_candidates": list,
+    "bgutil_provider_resolved": "disabled",
+    "youtube_fetch_po_token": "auto",
+}
+
+# Always forced for metadata scans, regardless of prior value
+_SCAN_FORCED_DEFAULTS = {
+    "skip_thumbs": True,  # Don't download thumbs during metadata scan
+    "skip_subtitles": True,  # Don't download subtitles during metadata scan
+    "allow_restricted": False,
+    "sleep_interval": 0.0,
+    "max_sleep_interval": 0.0,
+    "archive": None,
+    "rate_limit": None,
+    "concurrency": None,
+    "since": None,
+    "until": None,
+    "merge_output_format": None,
+    "format": None,
+}
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+
+    parser = _build_parser()
     args = parser.parse_args(argv)
 
     # Validate input
@@ -703,28 +1355,16 @@ def parse_args(argv=None) -> argparse.Namespace:
     downloader.apply_authentication_defaults(args)
 
     # Override BGUtil and PO token settings for metadata scanning
-    # These features can cause significant delays and are usually not needed for basic metadata extraction
-    if not hasattr(args, 'bgutil_provider') or args.bgutil_provider is None:
-        args.bgutil_provider = 'disabled'
-        args.bgutil_provider_candidates = []
-        args.bgutil_provider_resolved = 'disabled'
-    if not hasattr(args, 'youtube_fetch_po_token') or args.youtube_fetch_po_token is None:
-        args.youtube_fetch_po_token = 'auto'  # Changed from 'always' to 'auto'
+    # These features can cause significant delays and are usually not needed
+    # for basic metadata extraction; fill only the ones still unset
+    ns = vars(args)
+    for key, default in _SCAN_SOFT_DEFAULTS.items():
+        if ns.get(key) is None:
+            ns[key] = default() if callable(default) else default
 
     # Set defaults for attributes required by build_ydl_options
     # These aren't used during metadata scanning but are checked by the builder
-    args.skip_thumbs = True  # Don't download thumbs during metadata scan
-    args.skip_subtitles = True  # Don't download subtitles during metadata scan
-    args.allow_restricted = False
-    args.sleep_interval = 0.0
-    args.max_sleep_interval = 0.0
-    args.archive = None
-    args.rate_limit = None
-    args.concurrency = None
-    args.since = None
-    args.until = None
-    args.merge_output_format = None
-    args.format = None
+    ns.update(_SCAN_FORCED_DEFAULTS)
 
     return args
 
@@ -733,6 +1373,7 @@ def main(argv=None) -> int:
     """Main entry point."""
 
     args = parse_args(argv)
+    _configure_logging()
 
     print("=" * 70)
     print("YouTube Channel Metadata Scanner (Enhanced)")
@@ -776,13 +1417,14 @@ def main(argv=None) -> int:
             with open(args.output, "r", encoding="utf-8") as f:
                 data = json.load(f)
 
-            channels_count = len(data.get("channels", []))
+            channels_list = data.get("channels", [])
+            channels_count = len(channels_list)
             videos_count = data.get("total_videos", 0)
             scan_date = data.get("scan_date", "unknown")
 
-            # Count successful vs failed channels
-            successful = sum(1 for ch in data.get("channels", []) if not ch.get("error"))
-            failed = channels_count - successful
+            # Count successful vs failed channels in one pass
+            failed = sum(1 for ch in channels_list if ch.get("error"))
+            successful = channels_count - failed
 
             _log_with_timestamp(f"[metadata] Summary of existing data:")
             _log_with_timestamp(f"[metadata]   • Total channels: {channels_count} ({successful} successful, {failed} failed)")
@@ -814,7 +1456,7 @@ def main(argv=None) -> int:
     print(f"Total channels scanned: {cache.total_channels}")
     print(f"Total videos found: {cache.total_videos}")
 
-    failed_channels = [ch for ch in cache.channels if ch.error]
+    failed_channels = cache.failed_channels
     if failed_channels:
         print(f"\nWarning: {len(failed_channels)} channel(s) failed to scan:")
         for ch in failed_channels:
@@ -15,7 +15,7 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 # Mock the youtube_dl import since we're just testing metadata functions
 sys.modules['youtube_dl'] = type('Mock', (), {
-    'normalize_url': lambda x: x,
+    'normalize_url': staticmethod(lambda x: x),
     'Source': object,
     'ErrorAnalyzer': object,
 })()
@@ -44,10 +44,8 @@ def test_save_and_load():
                     kind="channel",
                     label="Test Channel",
                     scan_timestamp=datetime.now().isoformat(),
-                    videos=[
-                        {"video_id": "test123", "title": "Test Video 1"},
-                        {"video_id": "test456", "title": "Test Video 2"},
-                    ],
+                    video_ids=["test123", "test456"],
+                    titles=["Test Video 1", "Test Video 2"],
                     total_videos=2,
                     error=None,
                 )
@@ -64,12 +62,13 @@ def test_save_and_load():
         print(f"✓ Metadata file created: {output_path}")
 
         # Load metadata
-        loaded_cache = load_existing_metadata(output_path)
+        loaded_cache, loaded_urls = load_existing_metadata(output_path)
         assert loaded_cache is not None, "Failed to load metadata"
         assert loaded_cache.total_channels == 1, "Channel count mismatch"
         assert loaded_cache.total_videos == 2, "Video count mismatch"
         assert len(loaded_cache.channels) == 1, "Wrong number of channels"
         assert loaded_cache.channels[0].url == "https://youtube.com/@test"
+        assert "https://youtube.com/@test" in loaded_urls, "Normalized URL set missing channel"
         print("✓ Metadata loaded correctly")
 
         # Test incremental save (simulating adding another channel)
@@ -79,7 +78,8 @@ def test_save_and_load():
                 kind="channel",
                 label="Test Channel 2",
                 scan_timestamp=datetime.now().isoformat(),
-                videos=[{"video_id": "test789", "title": "Test Video 3"}],
+                video_ids=["test789"],
+                titles=["Test Video 3"],
                 total_videos=1,
                 error=None,
             )
@@ -96,7 +96,7 @@ def test_save_and_load():
         print(f"✓ Backup file created: {backup_path}")
 
         # Load and verify incremental save
-        loaded_cache = load_existing_metadata(output_path)
+        loaded_cache, _ = load_existing_metadata(output_path)
         assert loaded_cache.total_channels == 2, "Incremental save failed"
         assert loaded_cache.total_videos == 3, "Incremental save failed"
         print("✓ Incremental save works correctly")
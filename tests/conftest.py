@@ -0,0 +1,93 @@
+"""Shared fixtures for the test suite."""
+
+import copy
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+import youtube_dl as downloader  # noqa: E402  (needs the path entry above)
+
+# Union of the argument defaults the individual test modules used to rebuild
+# per call; built once per session and shared by the make_args fixture.
+_ARG_DEFAULTS = {
+    "output": "downloads",
+    "skip_thumbs": False,
+    "skip_subtitles": False,
+    "archive": None,
+    "rate_limit": None,
+    "concurrency": None,
+    "since": None,
+    "until": None,
+    "cookies_from_browser": None,
+    "sleep_requests": None,
+    "sleep_interval": None,
+    "max_sleep_interval": None,
+    "allow_restricted": False,
+    "youtube_client": None,
+    "youtube_fetch_po_token": None,
+    "youtube_po_token": [],
+    "youtube_player_params": None,
+    "no_shorts": False,
+    "max": None,
+    "format": None,
+    "proxy": None,
+    "proxy_file": None,
+    "failure_limit": downloader.DEFAULT_FAILURE_LIMIT,
+}
+
+# Template namespace built once; copy.copy duplicates its __dict__ in one
+# C-level dict copy instead of N setattr calls per make_args invocation.
+_DEFAULT_ARGS = SimpleNamespace(**_ARG_DEFAULTS)
+
+
+@pytest.fixture(scope="session")
+def make_args():
+    """Factory building a downloader-style args namespace with test defaults."""
+    # Auth defaults are opt-in: only tests asserting on auth-derived
+    # attributes (bgutil provider fields) pay for the extra pass. With an
+    # empty environ the result is deterministic, so the common
+    # no-override call clones a lazily built prototype.
+    prototypes = {}
+
+    def _make(*, apply_auth=False, **overrides):
+        if not overrides:
+            prototype = prototypes.get(apply_auth)
+            if prototype is None:
+                prototype = copy.copy(_DEFAULT_ARGS)
+                if apply_auth:
+                    downloader.apply_authentication_defaults(prototype, environ={})
+                prototypes[apply_auth] = prototype
+            return copy.copy(prototype)
+        args = copy.copy(_DEFAULT_ARGS)
+        args.__dict__.update(overrides)
+        if apply_auth:
+            downloader.apply_authentication_defaults(args, environ={})
+        return args
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def example_channel_source():
+    """Immutable channel Source shared by the download_source tests."""
+    return downloader.Source(
+        downloader.SourceType.CHANNEL, "https://www.youtube.com/@Example"
+    )
+
+
+@pytest.fixture(scope="session")
+def _shared_logger():
+    return downloader.DownloadLogger()
+
+
+@pytest.fixture
+def logger(_shared_logger):
+    """One DownloadLogger per session, reset in place for each test."""
+    _shared_logger.reset()
+    return _shared_logger
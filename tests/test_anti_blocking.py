@@ -1,13 +1,8 @@
 from __future__ import annotations
 
-import sys
-import tempfile
-from pathlib import Path
 from types import SimpleNamespace
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-import download_channel_videos as dc
+import youtube_dl.ytdlp_options as dc
 
 
 def test_user_agent_selection():
@@ -121,18 +116,19 @@ def test_rate_limit_backoff_calculation():
 def test_unavailable_rate_limiting_detection():
     """Test detection of excessive 'video unavailable' errors."""
     import time
+    from collections import deque
     logger = dc.DownloadLogger()
 
     # No rate limiting with less than 3 errors
-    logger.unavailable_timestamps = [time.time(), time.time()]
+    logger.unavailable_timestamps = deque([time.time(), time.time()])
     assert logger.check_unavailable_rate_limiting() is False
 
     # Rate limiting detected with 3+ errors in 10 seconds
     now = time.time()
-    logger.unavailable_timestamps = [now - 5, now - 3, now - 1]
+    logger.unavailable_timestamps = deque([now - 5, now - 3, now - 1])
     assert logger.check_unavailable_rate_limiting() is True
 
     # No rate limiting if errors are old
     old_time = time.time() - 15
-    logger.unavailable_timestamps = [old_time, old_time, old_time]
+    logger.unavailable_timestamps = deque([old_time, old_time, old_time])
     assert logger.check_unavailable_rate_limiting() is False
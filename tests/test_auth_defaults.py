@@ -1,12 +1,9 @@
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 from types import SimpleNamespace
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-import download_channel_videos as dc
+import youtube_dl.config as dc
+from youtube_dl.models import DEFAULT_BGUTIL_PROVIDER_MODE
 
 
 def make_args(**overrides):
@@ -27,7 +24,7 @@ def test_bgutil_defaults_populate_without_env():
     args = make_args()
     dc.apply_authentication_defaults(args, environ={})
 
-    assert args.bgutil_provider == dc.DEFAULT_BGUTIL_PROVIDER_MODE
+    assert args.bgutil_provider == DEFAULT_BGUTIL_PROVIDER_MODE
     assert args.bgutil_http_base_url == dc.DEFAULT_BGUTIL_HTTP_BASE_URL
     assert args.bgutil_provider_candidates == ["http"]
     assert args.bgutil_provider_resolved == "http"
@@ -47,7 +44,7 @@ def test_env_defaults_populate_missing_fields():
     assert args.cookies_from_browser == "chrome"
     assert args.youtube_po_token == ["web.web+abc123", "ios.ios+def456"]
     assert args.youtube_fetch_po_token == "never"
-    assert args.bgutil_provider == dc.DEFAULT_BGUTIL_PROVIDER_MODE
+    assert args.bgutil_provider == DEFAULT_BGUTIL_PROVIDER_MODE
     assert args.bgutil_provider_candidates == ["http"]
 
 
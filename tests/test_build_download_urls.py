@@ -1,9 +1,4 @@
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-from download_channel_videos import Source, SourceType
+from youtube_dl import Source, SourceType
 
 
 def test_channel_url_expands_to_videos_and_shorts():
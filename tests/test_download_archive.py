@@ -1,41 +1,6 @@
-import sys
-from pathlib import Path
-from types import SimpleNamespace
-
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-import download_channel_videos as dc
-
-
-def make_args(**overrides):
-    defaults = {
-        "output": "downloads",
-        "skip_thumbs": False,
-        "skip_subtitles": False,
-        "archive": None,
-        "rate_limit": None,
-        "concurrency": None,
-        "since": None,
-        "until": None,
-        "cookies_from_browser": None,
-        "sleep_requests": None,
-        "sleep_interval": None,
-        "max_sleep_interval": None,
-        "allow_restricted": False,
-        "youtube_client": None,
-        "youtube_fetch_po_token": None,
-        "youtube_po_token": [],
-        "youtube_player_params": None,
-        "no_shorts": False,
-        "max": None,
-        "failure_limit": dc.DEFAULT_FAILURE_LIMIT,
-    }
-    defaults.update(overrides)
-    args = SimpleNamespace(**defaults)
-    dc.apply_authentication_defaults(args, environ={})
-    return args
+import youtube_dl.downloader as dc
 
 
 def test_load_download_archive_reads_existing_ids(tmp_path):
@@ -49,17 +14,10 @@ def test_load_download_archive_reads_existing_ids(tmp_path):
     assert dc._load_download_archive(str(missing)) == set()
 
 
-def test_run_download_attempt_appends_to_archive(monkeypatch: pytest.MonkeyPatch, tmp_path):
+def test_run_download_attempt_appends_to_archive(make_args, monkeypatch: pytest.MonkeyPatch, tmp_path):
     archive_path = tmp_path / "archive.txt"
     args = make_args(output=str(tmp_path), archive=str(archive_path))
 
-    appended = []
-
-    def fake_append(path, video_id):
-        appended.append((path, video_id))
-
-    monkeypatch.setattr(dc, "_append_to_download_archive", fake_append)
-
     class FakeYoutubeDL:
         def __init__(self, params):
             self.params = params
@@ -87,15 +45,14 @@ def test_run_download_attempt_appends_to_archive(monkeypatch: pytest.MonkeyPatch
     )
 
     assert attempt.downloaded == 1
-    assert appended == [(str(archive_path), "fresh-video")]
+    # The attempt's ArchiveAppender flushes buffered ids when the attempt ends.
+    assert dc._load_download_archive(str(archive_path)) == {"fresh-video"}
 
 
-def test_run_download_attempt_skips_seen_ids(monkeypatch: pytest.MonkeyPatch, tmp_path):
+def test_run_download_attempt_skips_seen_ids(make_args, monkeypatch: pytest.MonkeyPatch, tmp_path):
     args = make_args(output=str(tmp_path), archive=str(tmp_path / "archive.txt"))
     seen_ids = {"existing"}
 
-    monkeypatch.setattr(dc, "_append_to_download_archive", lambda *a, **k: None)
-
     class FakeYoutubeDL:
         def __init__(self, params):
             self.params = params
@@ -129,7 +86,7 @@ def test_run_download_attempt_skips_seen_ids(monkeypatch: pytest.MonkeyPatch, tm
     assert "existing" in seen_ids
 
 
-def test_download_source_loads_archive_and_updates(monkeypatch: pytest.MonkeyPatch, tmp_path):
+def test_download_source_loads_archive_and_updates(make_args, monkeypatch: pytest.MonkeyPatch, tmp_path):
     archive_path = tmp_path / "archive.txt"
     archive_path.write_text("seen-id\n", encoding="utf-8")
 
@@ -143,8 +100,6 @@ def test_download_source_loads_archive_and_updates(monkeypatch: pytest.MonkeyPat
     def fake_append(path, video_id):
         appended.append((path, video_id))
 
-    monkeypatch.setattr(dc, "_append_to_download_archive", fake_append)
-
     writes = []
 
     def fake_write(path, video_ids):
@@ -184,7 +139,6 @@ def test_download_source_loads_archive_and_updates(monkeypatch: pytest.MonkeyPat
 
     assert captured_sets and "seen-id" in captured_sets[0]
     assert appended.count((str(archive_path), "fresh-id")) == 1
-    assert writes
-    written_path, recorded_ids = writes[-1]
-    assert written_path == str(archive_path)
-    assert recorded_ids >= {"seen-id", "fresh-id"}
+    # Steady state is append-only: one new id on top of one known id does not
+    # cross the doubling threshold, so no full rewrite (compaction) happens.
+    assert writes == []
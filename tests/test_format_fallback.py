@@ -1,46 +1,11 @@
-import sys
-from pathlib import Path
-from types import SimpleNamespace
 from typing import Optional
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-import download_channel_videos as dc
-
-
-def make_args(**overrides):
-    defaults = {
-        "output": "downloads",
-        "skip_thumbs": False,
-        "skip_subtitles": False,
-        "archive": None,
-        "rate_limit": None,
-        "concurrency": None,
-        "since": None,
-        "until": None,
-        "cookies_from_browser": None,
-        "sleep_requests": None,
-        "sleep_interval": None,
-        "max_sleep_interval": None,
-        "allow_restricted": False,
-        "youtube_client": None,
-        "youtube_fetch_po_token": None,
-        "youtube_po_token": [],
-        "youtube_player_params": None,
-        "no_shorts": False,
-        "max": None,
-        "format": None,
-    }
-    defaults.update(overrides)
-    args = SimpleNamespace(**defaults)
-    dc.apply_authentication_defaults(args, environ={})
-    return args
-
-
-def test_ios_client_uses_format_fallback(monkeypatch: pytest.MonkeyPatch, capsys) -> None:
-    source = dc.Source(dc.SourceType.CHANNEL, "https://www.youtube.com/@Example")
+import youtube_dl.downloader as dc
+
+
+def test_ios_client_uses_format_fallback(make_args, example_channel_source, monkeypatch: pytest.MonkeyPatch, capsys) -> None:
     args = make_args(format="bestvideo+bestaudio/best", no_shorts=True)
 
     monkeypatch.setattr(dc, "DEFAULT_PLAYER_CLIENTS", ("ios", "web"))
@@ -86,7 +51,7 @@ def test_ios_client_uses_format_fallback(monkeypatch: pytest.MonkeyPatch, capsys
     monkeypatch.setattr(dc.yt_dlp, "YoutubeDL", FakeYoutubeDL)
     FakeYoutubeDL.calls = []
 
-    dc.download_source(source, args)
+    dc.download_source(example_channel_source, args)
 
     out, err = capsys.readouterr()
 
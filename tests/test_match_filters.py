@@ -2,49 +2,22 @@
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-from types import SimpleNamespace
+import collections
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-import download_channel_videos as dc
-
-
-def make_args(**overrides):
-    defaults = {
-        "output": "downloads",
-        "skip_thumbs": False,
-        "skip_subtitles": False,
-        "archive": None,
-        "rate_limit": None,
-        "concurrency": None,
-        "since": None,
-        "until": None,
-        "cookies_from_browser": None,
-        "sleep_requests": None,
-        "sleep_interval": None,
-        "max_sleep_interval": None,
-        "allow_restricted": False,
-        "youtube_fetch_po_token": None,
-        "youtube_po_token": [],
-        "youtube_player_params": None,
-    }
-    defaults.update(overrides)
-    args = SimpleNamespace(**defaults)
-    dc.apply_authentication_defaults(args, environ={})
-    return args
-
-
-def test_build_ydl_options_combines_filters(tmp_path):
-    args = make_args(output=str(tmp_path))
-    logger = dc.DownloadLogger()
-    called = []
+import youtube_dl.downloader as dc
+from youtube_dl.models import DEFAULT_BGUTIL_HTTP_BASE_URL
+
+
+@pytest.fixture(scope="module")
+def built_opts(make_args, tmp_path_factory):
+    """Build the yt-dlp options dict once per module; tests only probe match_filter."""
+    args = make_args(output=str(tmp_path_factory.mktemp("filters")))
+    called = collections.Counter()
 
     def extra_filter(info_dict):
-        called.append(info_dict.get("id"))
+        called[info_dict.get("id")] += 1
         if info_dict.get("id") == "duplicate":
             return "duplicate video"
         return None
@@ -52,36 +25,49 @@ def test_build_ydl_options_combines_filters(tmp_path):
     opts = dc.build_ydl_options(
         args,
         player_client=None,
-        logger=logger,
+        logger=dc.DownloadLogger(),
         hook=lambda _: None,
         additional_filters=[extra_filter],
     )
+    return opts, called
+
 
+@pytest.mark.parametrize(
+    "info_dict, expected_substring",
+    [
+        # Extra filter short-circuits duplicates.
+        ({"id": "duplicate"}, "duplicate video"),
+        # Restricted videos are still flagged even when the extra filter does not match first.
+        ({"id": "restricted", "availability": "premium_only"}, "premium"),
+        # Non-filtered videos pass through without raising.
+        ({"id": "ok"}, None),
+    ],
+    ids=["duplicate", "restricted", "passthrough"],
+)
+def test_build_ydl_options_combines_filters(built_opts, info_dict, expected_substring):
+    opts, called = built_opts
     match_filter = opts.get("match_filter")
     assert match_filter is not None
 
-    # Extra filter short-circuits duplicates.
-    assert match_filter({"id": "duplicate"}) == "duplicate video"
-
-    # Restricted videos are still flagged even when the extra filter does not match first.
-    reason = match_filter({"id": "restricted", "availability": "premium_only"})
-    assert "premium" in reason.lower()
-
-    # Non-filtered videos pass through without raising.
-    assert match_filter({"id": "ok"}) is None
+    reason = match_filter(info_dict)
+    if expected_substring is None:
+        assert reason is None
+    else:
+        assert expected_substring in reason.lower()
 
-    # Ensure the extra filter was invoked for the checks above.
-    assert called.count("duplicate") == 1
+    if expected_substring == "duplicate video":
+        # The verdict came from the extra filter, not a built-in check.
+        assert called["duplicate"] == 1
 
 
-def test_build_ydl_options_includes_youtube_specific_args(tmp_path):
+def test_build_ydl_options_includes_youtube_specific_args(make_args, logger, tmp_path):
     args = make_args(
+        apply_auth=True,
         output=str(tmp_path),
         youtube_fetch_po_token="always",
         youtube_po_token=["web.gvs+TOKEN"],
         youtube_player_params="8AEB",
     )
-    logger = dc.DownloadLogger()
 
     opts = dc.build_ydl_options(
         args,
@@ -101,7 +87,7 @@ def test_build_ydl_options_includes_youtube_specific_args(tmp_path):
     assert youtube_args["player_params"] == ["8AEB"]
     provider_args = extractor_args.get("youtubepot-bgutilhttp")
     assert provider_args is not None
-    assert provider_args.get("base_url") == [dc.DEFAULT_BGUTIL_HTTP_BASE_URL]
+    assert provider_args.get("base_url") == [DEFAULT_BGUTIL_HTTP_BASE_URL]
     assert "disable_innertube" not in provider_args
     assert getattr(args, "bgutil_provider_candidates") == ["http"]
 
@@ -114,35 +100,28 @@ def test_build_ydl_options_includes_youtube_specific_args(tmp_path):
         ("Some other random failure", "other"),
         ("Channel XYZ does not have a Shorts tab", "ignored"),
     ],
+    ids=["unavailable", "age-gate", "private", "other", "shorts-tab"],
 )
-def test_download_logger_classification(message: str, expected: str) -> None:
-    logger = dc.DownloadLogger()
-    logger.error(message)
-    if expected == "unavailable":
-        assert logger.video_unavailable_errors == 1
-        assert logger.other_errors == 0
-    elif expected == "ignored":
-        assert logger.video_unavailable_errors == 0
-        assert logger.other_errors == 0
-    else:
-        assert logger.video_unavailable_errors == 0
-        assert logger.other_errors == 1
-
-    # Exceptions should be classified the same way.
-    logger.record_exception(RuntimeError(message))
-    if expected == "unavailable":
-        assert logger.video_unavailable_errors == 2
-        assert logger.other_errors == 0
-    elif expected == "ignored":
-        assert logger.video_unavailable_errors == 0
-        assert logger.other_errors == 0
-    else:
-        assert logger.video_unavailable_errors == 0
-        assert logger.other_errors == 2
+def test_download_logger_classification(logger, message: str, expected: str) -> None:
+    # Per-call increments for (video_unavailable_errors, other_errors);
+    # exceptions must be classified the same way as error messages.
+    unavailable_step, other_step = {
+        "unavailable": (1, 0),
+        "ignored": (0, 0),
+        "other": (0, 1),
+    }[expected]
+
+    actions = (
+        lambda: logger.error(message),
+        lambda: logger.record_exception(RuntimeError(message)),
+    )
+    for count, action in enumerate(actions, start=1):
+        action()
+        assert logger.video_unavailable_errors == unavailable_step * count
+        assert logger.other_errors == other_step * count
 
 
-def test_download_logger_retryable_errors() -> None:
-    logger = dc.DownloadLogger()
+def test_download_logger_retryable_errors(logger) -> None:
     logger.set_video("abc123def45")
     logger.error("HTTP Error 403: Forbidden")
     assert logger.retryable_error_ids == {"abc123def45"}
@@ -2,14 +2,9 @@
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-import download_channel_videos as dc
+import youtube_dl as dc
 
 
 @pytest.mark.parametrize(
@@ -32,6 +27,7 @@ import download_channel_videos as dc
             "https://example.com/list#frag",
         ),
     ],
+    ids=["trailing-comment", "infer-video", "playlist-comment", "fragment-preserved"],
 )
 def test_parse_source_line_strips_inline_comments(raw, expected_kind, expected_url):
     source = dc.parse_source_line(raw)
@@ -55,6 +51,7 @@ def test_parse_source_line_missing_url_after_comment():
         ("https://www.youtube.com/@OpenAI", dc.SourceType.CHANNEL),
         ("https://www.youtube.com/channel/UC123", dc.SourceType.CHANNEL),
     ],
+    ids=["watch", "shorts", "live", "playlist", "handle", "channel-id"],
 )
 def test_infer_source_kind_without_prefix(raw, expected_kind):
     source = dc.parse_source_line(raw)
@@ -0,0 +1,48 @@
+"""Tests for populating the download queue from scan metadata."""
+
+from __future__ import annotations
+
+import json
+
+import queue_manager
+
+
+def _write_metadata(path, channel: dict) -> str:
+    metadata = {"version": 2, "channels": [channel]}
+    path.write_text(json.dumps(metadata), encoding="utf-8")
+    return str(path)
+
+
+def test_populate_queue_reads_schema_v2_parallel_arrays(tmp_path) -> None:
+    metadata_path = _write_metadata(
+        tmp_path / "metadata.json",
+        {
+            "url": "https://www.youtube.com/@Example",
+            "video_ids": ["vid1", "vid2"],
+            "titles": ["First", None],
+        },
+    )
+    queue = queue_manager.DownloadQueue(queue_file=str(tmp_path / "queue.json"))
+
+    queue_manager.populate_queue_from_metadata(metadata_path, queue)
+
+    assert [(v.video_id, v.title) for v in queue.videos] == [
+        ("vid1", "First"),
+        ("vid2", None),
+    ]
+    assert queue.videos[0].channel_url == "https://www.youtube.com/@Example"
+
+
+def test_populate_queue_reads_legacy_video_dicts(tmp_path) -> None:
+    metadata_path = _write_metadata(
+        tmp_path / "metadata.json",
+        {
+            "url": "https://www.youtube.com/@Example",
+            "videos": [{"video_id": "vid1", "title": "First"}],
+        },
+    )
+    queue = queue_manager.DownloadQueue(queue_file=str(tmp_path / "queue.json"))
+
+    queue_manager.populate_queue_from_metadata(metadata_path, queue)
+
+    assert [(v.video_id, v.title) for v in queue.videos] == [("vid1", "First")]
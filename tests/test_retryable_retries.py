@@ -2,54 +2,94 @@
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-from types import SimpleNamespace
+import contextlib
+import re
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
-import download_channel_videos as dc
-
-
-def make_args(**overrides):
-    defaults = {
-        "output": "downloads",
-        "skip_thumbs": False,
-        "skip_subtitles": False,
-        "archive": None,
-        "rate_limit": None,
-        "concurrency": None,
-        "since": None,
-        "until": None,
-        "cookies_from_browser": None,
-        "sleep_requests": None,
-        "sleep_interval": None,
-        "max_sleep_interval": None,
-        "allow_restricted": False,
-        "youtube_client": None,
-        "youtube_fetch_po_token": None,
-        "youtube_po_token": [],
-        "youtube_player_params": None,
-        "no_shorts": False,
-        "max": None,
-        "failure_limit": dc.DEFAULT_FAILURE_LIMIT,
-    }
-    defaults.update(overrides)
-    args = SimpleNamespace(**defaults)
-    dc.apply_authentication_defaults(args, environ={})
-    return args
-
-
-def test_download_source_retries_next_client_on_retryable(monkeypatch: pytest.MonkeyPatch) -> None:
-    source = dc.Source(dc.SourceType.CHANNEL, "https://www.youtube.com/@Example")
-    args = make_args()
+import youtube_dl.downloader as dc
+
+# Shared no-op success result; DownloadAttempt is frozen, so the fakes can
+# return the same instance instead of reallocating it per call.
+# Compiled once: the summary assertions scan captured.out directly instead
+# of splitting it into lines and scanning each one. ANSI colour sequences
+# sit between each label and its count.
+_ANSI_GAP = r"(?:\x1b\[[0-9;]*m|\s)*"
+# One pass checks both the banner colour and the heading, and that the
+# colour sequence precedes it.
+_SUMMARY_RE = re.compile(r"\x1b\[1;45;97m.*Summary for @Example", re.DOTALL)
+_DETECTED_RE = re.compile(r"Total videos detected:" + _ANSI_GAP + r"(\d+)")
+_DOWNLOADED_RE = re.compile(r"Total videos downloaded:" + _ANSI_GAP + r"(\d+)")
+_PENDING_RE = re.compile(r"Total videos not downloaded:" + _ANSI_GAP + r"(\d+)")
+
+# Channel listing reused by the summary test; built once at import.
+_THREE_VIDS = [
+    dc.VideoMetadata("vid1", None),
+    dc.VideoMetadata("vid2", None),
+    dc.VideoMetadata("vid3", None),
+]
+
+_EMPTY_ATTEMPT = dc.DownloadAttempt(
+    downloaded=0,
+    video_unavailable_errors=0,
+    other_errors=0,
+    retryable_error_ids=frozenset(),
+    stopped_due_to_limit=False,
+)
+
+
+@contextlib.contextmanager
+def _swapped_attrs(obj, **replacements):
+    """Swap attributes for the duration of the block without pytest's
+    per-attribute monkeypatch bookkeeping."""
+    originals = {name: getattr(obj, name) for name in replacements}
+    for name, value in replacements.items():
+        setattr(obj, name, value)
+    try:
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(obj, name, value)
+
+
+class FakeYoutubeDL:
+    """Minimal YoutubeDL stand-in; download() delegates to a per-test callable."""
+
+    def __init__(self, params, download_fn):
+        self.params = params
+        self._download_fn = download_fn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def download(self, urls):
+        return self._download_fn(self, urls)
+
+
+def _install_fake_ydl(monkeypatch, download_fn):
+    monkeypatch.setattr(
+        dc.yt_dlp, "YoutubeDL", lambda params: FakeYoutubeDL(params, download_fn)
+    )
+
+
+@pytest.fixture(autouse=True)
+def _default_player_clients(monkeypatch: pytest.MonkeyPatch):
+    """Baseline patches shared by every test in this module.
 
+    Tests that need a different client tuple or video listing re-patch on
+    top of these.
+    """
     monkeypatch.setattr(dc, "DEFAULT_PLAYER_CLIENTS", ("tv", "web_safari"))
     monkeypatch.setattr(dc, "PLAYER_CLIENT_CHOICES", ("tv", "web_safari"))
     monkeypatch.setattr(dc, "collect_all_video_ids", lambda *a, **k: [])
 
+
+def test_download_source_retries_next_client_on_retryable(make_args, example_channel_source) -> None:
+    args = make_args()
+
     calls = []
 
     def fake_run_download_attempt(
@@ -88,24 +128,28 @@ def test_download_source_retries_next_client_on_retryable(monkeypatch: pytest.Mo
             stopped_due_to_limit=False,
         )
 
-    monkeypatch.setattr(dc, "run_download_attempt", fake_run_download_attempt)
-
-    dc.download_source(source, args)
+    with _swapped_attrs(dc, run_download_attempt=fake_run_download_attempt):
+        dc.download_source(example_channel_source, args)
 
     assert len(calls) == 2
-    assert calls[0]["client"] == dc.DEFAULT_PLAYER_CLIENTS[0]
-    assert calls[1]["client"] == dc.DEFAULT_PLAYER_CLIENTS[1]
+    assert calls[0]["client"] == "tv"
+    assert calls[1]["client"] == "web_safari"
     assert calls[1]["target_video_ids"] == {"retry-id"}
-
-
-def test_download_source_cycles_on_other_errors(monkeypatch: pytest.MonkeyPatch) -> None:
-    source = dc.Source(dc.SourceType.CHANNEL, "https://www.youtube.com/@Example")
+    # The retry hits the flagged videos directly instead of re-enumerating
+    # the channel.
+    assert calls[1]["urls"] == ("https://www.youtube.com/watch?v=retry-id",)
+
+
+@pytest.mark.parametrize(
+    "error_field",
+    ["other_errors", "video_unavailable_errors"],
+    ids=["other-errors", "unavailable"],
+)
+def test_download_source_cycles_on_error_kind(
+    make_args, example_channel_source, monkeypatch: pytest.MonkeyPatch, error_field
+) -> None:
     args = make_args()
 
-    monkeypatch.setattr(dc, "DEFAULT_PLAYER_CLIENTS", ("tv", "web_safari"))
-    monkeypatch.setattr(dc, "PLAYER_CLIENT_CHOICES", ("tv", "web_safari"))
-    monkeypatch.setattr(dc, "collect_all_video_ids", lambda *a, **k: [])
-
     calls = []
 
     def fake_run_download_attempt(
@@ -117,87 +161,41 @@ def test_download_source_cycles_on_other_errors(monkeypatch: pytest.MonkeyPatch)
         target_video_ids=None,
         failure_limit=dc.DEFAULT_FAILURE_LIMIT,
     ):
-        calls.append({"client": client, "urls": tuple(urls), "seen": set(downloaded_ids)})
-        if len(calls) == 1:
-            downloaded_ids.add("first-id")
-            return dc.DownloadAttempt(
-                downloaded=1,
-                video_unavailable_errors=0,
-                other_errors=2,
-                retryable_error_ids=set(),
-                stopped_due_to_limit=False,
-            )
-        assert "first-id" in downloaded_ids
-        return dc.DownloadAttempt(
-            downloaded=0,
-            video_unavailable_errors=0,
-            other_errors=0,
-            retryable_error_ids=set(),
-            stopped_due_to_limit=False,
+        # Record O(1) facts instead of copying the growing id set per call.
+        calls.append(
+            {
+                "client": client,
+                "urls": tuple(urls),
+                "seen_size": len(downloaded_ids),
+                "had_first": "first-id" in downloaded_ids,
+            }
         )
-
-    monkeypatch.setattr(dc, "run_download_attempt", fake_run_download_attempt)
-
-    dc.download_source(source, args)
-
-    assert len(calls) == 2
-    assert calls[0]["client"] == dc.DEFAULT_PLAYER_CLIENTS[0]
-    assert calls[1]["client"] == dc.DEFAULT_PLAYER_CLIENTS[1]
-    assert calls[0]["seen"] == set()
-    assert calls[1]["seen"] == {"first-id"}
-
-
-def test_download_source_retries_after_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
-    source = dc.Source(dc.SourceType.CHANNEL, "https://www.youtube.com/@Example")
-    args = make_args()
-
-    monkeypatch.setattr(dc, "DEFAULT_PLAYER_CLIENTS", ("tv", "web_safari"))
-    monkeypatch.setattr(dc, "PLAYER_CLIENT_CHOICES", ("tv", "web_safari"))
-    monkeypatch.setattr(dc, "collect_all_video_ids", lambda *a, **k: [])
-
-    calls = []
-
-    def fake_run_download_attempt(
-        urls,
-        args_,
-        client,
-        max_total,
-        downloaded_ids,
-        target_video_ids=None,
-        failure_limit=dc.DEFAULT_FAILURE_LIMIT,
-    ):
-        calls.append({"client": client, "urls": tuple(urls), "seen": set(downloaded_ids)})
         if len(calls) == 1:
             downloaded_ids.add("first-id")
+            counts = {"video_unavailable_errors": 0, "other_errors": 0}
+            counts[error_field] = 2
             return dc.DownloadAttempt(
                 downloaded=1,
-                video_unavailable_errors=2,
-                other_errors=0,
                 retryable_error_ids=set(),
                 stopped_due_to_limit=False,
+                **counts,
             )
         assert "first-id" in downloaded_ids
-        return dc.DownloadAttempt(
-            downloaded=0,
-            video_unavailable_errors=0,
-            other_errors=0,
-            retryable_error_ids=set(),
-            stopped_due_to_limit=False,
-        )
+        return _EMPTY_ATTEMPT
 
     monkeypatch.setattr(dc, "run_download_attempt", fake_run_download_attempt)
 
-    dc.download_source(source, args)
+    dc.download_source(example_channel_source, args)
 
     assert len(calls) == 2
     assert calls[0]["client"] == dc.DEFAULT_PLAYER_CLIENTS[0]
     assert calls[1]["client"] == dc.DEFAULT_PLAYER_CLIENTS[1]
-    assert calls[0]["seen"] == set()
-    assert calls[1]["seen"] == {"first-id"}
+    assert calls[0]["seen_size"] == 0
+    assert not calls[0]["had_first"]
+    assert calls[1]["had_first"]
 
 
-def test_download_source_uses_configured_failure_limit(monkeypatch: pytest.MonkeyPatch) -> None:
-    source = dc.Source(dc.SourceType.CHANNEL, "https://www.youtube.com/@Example")
+def test_download_source_uses_configured_failure_limit(make_args, example_channel_source, monkeypatch: pytest.MonkeyPatch) -> None:
     args = make_args(failure_limit=7)
 
     monkeypatch.setattr(dc, "DEFAULT_PLAYER_CLIENTS", ("tv",))
@@ -226,26 +224,15 @@ def test_download_source_uses_configured_failure_limit(monkeypatch: pytest.Monke
 
     monkeypatch.setattr(dc, "run_download_attempt", fake_run_download_attempt)
 
-    dc.download_source(source, args)
+    dc.download_source(example_channel_source, args)
 
     assert captured_limits == [args.failure_limit]
 
 
-def test_download_source_prints_summary(monkeypatch: pytest.MonkeyPatch, capsys) -> None:
-    source = dc.Source(dc.SourceType.CHANNEL, "https://www.youtube.com/@Example")
+def test_download_source_prints_summary(make_args, example_channel_source, monkeypatch: pytest.MonkeyPatch, capsys) -> None:
     args = make_args()
 
-    monkeypatch.setattr(dc, "DEFAULT_PLAYER_CLIENTS", ("tv", "web_safari"))
-    monkeypatch.setattr(dc, "PLAYER_CLIENT_CHOICES", ("tv", "web_safari"))
-    monkeypatch.setattr(
-        dc,
-        "collect_all_video_ids",
-        lambda *a, **k: [
-            dc.VideoMetadata("vid1", None),
-            dc.VideoMetadata("vid2", None),
-            dc.VideoMetadata("vid3", None),
-        ],
-    )
+    monkeypatch.setattr(dc, "collect_all_video_ids", lambda *a, **k: _THREE_VIDS)
 
     def fake_run_download_attempt(
         urls,
@@ -268,29 +255,23 @@ def test_download_source_prints_summary(monkeypatch: pytest.MonkeyPatch, capsys)
 
     monkeypatch.setattr(dc, "run_download_attempt", fake_run_download_attempt)
 
-    dc.download_source(source, args)
+    dc.download_source(example_channel_source, args)
 
     captured = capsys.readouterr()
-    assert "\033[1;45;97m" in captured.out
-    assert "Summary for @Example" in captured.out
+    assert _SUMMARY_RE.search(captured.out)
 
-    lines = captured.out.splitlines()
-    detected_line = next(line for line in lines if "Total videos detected:" in line)
-    downloaded_line = next(line for line in lines if "Total videos downloaded:" in line)
-    pending_line = next(line for line in lines if "Total videos not downloaded:" in line)
+    detected = _DETECTED_RE.search(captured.out)
+    downloaded = _DOWNLOADED_RE.search(captured.out)
+    pending = _PENDING_RE.search(captured.out)
 
-    assert "3" in detected_line
-    assert "2" in downloaded_line
-    assert "1" in pending_line
+    assert detected and detected.group(1) == "3"
+    assert downloaded and downloaded.group(1) == "2"
+    assert pending and pending.group(1) == "1"
 
-def test_download_source_cycles_after_user_selected_client(monkeypatch: pytest.MonkeyPatch) -> None:
-    source = dc.Source(dc.SourceType.CHANNEL, "https://www.youtube.com/@Example")
+def test_download_source_cycles_after_user_selected_client(make_args, example_channel_source, monkeypatch: pytest.MonkeyPatch) -> None:
     primary = dc.DEFAULT_PLAYER_CLIENTS[-1]
     args = make_args(youtube_client=primary)
 
-    monkeypatch.setattr(dc, "collect_all_video_ids", lambda *a, **k: [])
-    monkeypatch.setattr(dc, "PLAYER_CLIENT_CHOICES", tuple(dc.DEFAULT_PLAYER_CLIENTS))
-
     calls = []
 
     def fake_run_download_attempt(
@@ -321,7 +302,7 @@ def test_download_source_cycles_after_user_selected_client(monkeypatch: pytest.M
 
     monkeypatch.setattr(dc, "run_download_attempt", fake_run_download_attempt)
 
-    dc.download_source(source, args)
+    dc.download_source(example_channel_source, args)
 
     fallback_order = [client for client in dc.DEFAULT_PLAYER_CLIENTS if client != primary]
     assert len(calls) >= 2
@@ -329,15 +310,13 @@ def test_download_source_cycles_after_user_selected_client(monkeypatch: pytest.M
     assert calls[1] == fallback_order[0]
 
 
-def test_download_source_limits_attempts_per_client(monkeypatch: pytest.MonkeyPatch, capsys) -> None:
-    source = dc.Source(dc.SourceType.CHANNEL, "https://www.youtube.com/@Example")
+def test_download_source_limits_attempts_per_client(make_args, example_channel_source, monkeypatch: pytest.MonkeyPatch, capsys) -> None:
     args = make_args()
 
-    monkeypatch.setattr(dc, "DEFAULT_PLAYER_CLIENTS", ("tv", "web_safari"))
-    monkeypatch.setattr(dc, "PLAYER_CLIENT_CHOICES", ("tv", "web_safari"))
-    monkeypatch.setattr(dc, "collect_all_video_ids", lambda *a, **k: [])
-
-    calls = []
+    # Two counters and a last-seen slot capture everything the assertions
+    # need without growing a per-call list.
+    counts = {"tv": 0, "web_safari": 0}
+    last_client = [None]
 
     def fake_run_download_attempt(
         urls,
@@ -348,15 +327,12 @@ def test_download_source_limits_attempts_per_client(monkeypatch: pytest.MonkeyPa
         target_video_ids=None,
         failure_limit=dc.DEFAULT_FAILURE_LIMIT,
     ):
-        calls.append(client)
+        counts[client] += 1
+        last_client[0] = client
         if client == "tv":
-            return dc.DownloadAttempt(
-                downloaded=0,
-                video_unavailable_errors=0,
-                other_errors=0,
-                retryable_error_ids=set(),
-                stopped_due_to_limit=False,
-            )
+            # The switch must happen only after every tv attempt failed.
+            assert counts["web_safari"] == 0
+            return _EMPTY_ATTEMPT
         return dc.DownloadAttempt(
             downloaded=1,
             video_unavailable_errors=0,
@@ -367,52 +343,45 @@ def test_download_source_limits_attempts_per_client(monkeypatch: pytest.MonkeyPa
 
     monkeypatch.setattr(dc, "run_download_attempt", fake_run_download_attempt)
 
-    dc.download_source(source, args)
+    dc.download_source(example_channel_source, args)
 
     captured = capsys.readouterr()
 
-    assert len(calls) == dc.MAX_ATTEMPTS_PER_CLIENT + 1
-    assert calls[: dc.MAX_ATTEMPTS_PER_CLIENT] == ["tv"] * dc.MAX_ATTEMPTS_PER_CLIENT
-    assert calls.count("tv") == dc.MAX_ATTEMPTS_PER_CLIENT
-    assert calls[dc.MAX_ATTEMPTS_PER_CLIENT] == "web_safari"
+    assert counts["tv"] == dc.MAX_ATTEMPTS_PER_CLIENT
+    assert counts["web_safari"] == 1
+    assert last_client[0] == "web_safari"
     assert "5 consecutive failed attempts" in captured.out
 
 
 def test_run_download_attempt_respects_failure_threshold(
-    monkeypatch: pytest.MonkeyPatch, capsys
+    make_args, monkeypatch: pytest.MonkeyPatch, capsys
 ) -> None:
     args = make_args()
 
     limit = args.failure_limit
 
-    class FakeYoutubeDL:
-        def __init__(self, params):
-            self.params = params
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-        def download(self, urls):
-            assert urls == ["https://www.youtube.com/watch?v=example"]
-            hooks = self.params.get("progress_hooks") or []
-            assert hooks, "Expected at least one progress hook"
-            hook = hooks[0]
-            info = {"id": "video-1", "title": "Example"}
-            payload = {
-                "status": "error",
-                "info_dict": info,
-                "error": "HTTP Error 403: Forbidden",
-            }
-            for _ in range(limit):
-                try:
-                    hook(dict(payload))
-                except dc.DownloadCancelled:
-                    raise
+    def fake_download(fake, urls):
+        assert urls == ["https://www.youtube.com/watch?v=example"]
+        hooks = fake.params.get("progress_hooks") or []
+        assert hooks, "Expected at least one progress hook"
+        hook = hooks[0]
+        info = {"id": "video-1", "title": "Example"}
+        # Retryable but not a 403: HTTP 403s now trigger rate-limit
+        # backoff pauses and a forced client switch after four errors,
+        # which is covered separately. PO-token errors exercise the
+        # plain consecutive-failure accounting this test is about.
+        payload = {
+            "status": "error",
+            "info_dict": info,
+            "error": "PO token required for playback",
+        }
+        for _ in range(limit):
+            try:
+                hook(payload.copy())
+            except dc.DownloadCancelled:
+                raise
 
-    monkeypatch.setattr(dc.yt_dlp, "YoutubeDL", FakeYoutubeDL)
+    _install_fake_ydl(monkeypatch, fake_download)
 
     attempt = dc.run_download_attempt(
         ["https://www.youtube.com/watch?v=example"],
@@ -434,36 +403,26 @@ def test_run_download_attempt_respects_failure_threshold(
 
 
 def test_run_download_attempt_logger_errors_trigger_failure_limit(
-    monkeypatch: pytest.MonkeyPatch, capsys
+    make_args, monkeypatch: pytest.MonkeyPatch, capsys
 ) -> None:
     args = make_args()
 
     limit = args.failure_limit
 
-    class FakeYoutubeDL:
-        def __init__(self, params):
-            self.params = params
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-        def download(self, urls):
-            assert urls == ["https://www.youtube.com/watch?v=example"]
-            logger = self.params.get("logger")
-            assert isinstance(logger, dc.DownloadLogger)
-            for idx in range(limit):
-                logger.set_video(f"video-{idx}")
-                try:
-                    logger.error("Requested format is not available")
-                except dc.DownloadCancelled:
-                    raise
-                finally:
-                    logger.set_video(None)
+    def fake_download(fake, urls):
+        assert urls == ["https://www.youtube.com/watch?v=example"]
+        logger = fake.params.get("logger")
+        assert isinstance(logger, dc.DownloadLogger)
+        for idx in range(limit):
+            logger.set_video(f"video-{idx}")
+            try:
+                logger.error("Requested format is not available")
+            except dc.DownloadCancelled:
+                raise
+            finally:
+                logger.set_video(None)
 
-    monkeypatch.setattr(dc.yt_dlp, "YoutubeDL", FakeYoutubeDL)
+    _install_fake_ydl(monkeypatch, fake_download)
 
     attempt = dc.run_download_attempt(
         ["https://www.youtube.com/watch?v=example"],
@@ -486,65 +445,55 @@ def test_run_download_attempt_logger_errors_trigger_failure_limit(
 
 
 def test_run_download_attempt_consecutive_resets_after_success(
-    monkeypatch: pytest.MonkeyPatch,
+    make_args, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     args = make_args()
 
-    class FakeYoutubeDL:
-        def __init__(self, params):
-            self.params = params
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-        def download(self, urls):
-            assert urls == ["https://www.youtube.com/watch?v=example"]
-            hooks = self.params.get("progress_hooks") or []
-            assert hooks, "Expected at least one progress hook"
-            hook = hooks[0]
-            logger = self.params.get("logger")
-            assert isinstance(logger, dc.DownloadLogger)
-
-            info1 = {"id": "video-1", "title": "Example 1"}
-            fail_payload = {
-                "status": "error",
-                "info_dict": info1,
-                "error": "HTTP Error 403: Forbidden",
-            }
-            finish_payload = {"status": "finished", "info_dict": info1}
-
-            try:
-                hook(dict(fail_payload))
-            except dc.DownloadCancelled:
-                pytest.fail("failure limit triggered unexpectedly")
-
-            hook(dict(finish_payload))
-
-            info2 = {"id": "video-2", "title": "Example 2"}
-            logger.set_video("video-2")
-            try:
-                logger.error("This video is private")
-            finally:
-                logger.set_video(None)
-
-            hook({"status": "finished", "info_dict": info2})
-
-            info3 = {"id": "video-3", "title": "Example 3"}
-            try:
-                hook(
-                    {
-                        "status": "error",
-                        "info_dict": info3,
-                        "error": "HTTP Error 403: Forbidden",
-                    }
-                )
-            except dc.DownloadCancelled:
-                pytest.fail("consecutive failures should have reset after success")
+    def fake_download(fake, urls):
+        assert urls == ["https://www.youtube.com/watch?v=example"]
+        hooks = fake.params.get("progress_hooks") or []
+        assert hooks, "Expected at least one progress hook"
+        hook = hooks[0]
+        logger = fake.params.get("logger")
+        assert isinstance(logger, dc.DownloadLogger)
+
+        info1 = {"id": "video-1", "title": "Example 1"}
+        fail_payload = {
+            "status": "error",
+            "info_dict": info1,
+            "error": "PO token required for playback",
+        }
+        finish_payload = {"status": "finished", "info_dict": info1}
+
+        try:
+            hook(fail_payload.copy())
+        except dc.DownloadCancelled:
+            pytest.fail("failure limit triggered unexpectedly")
+
+        hook(dict(finish_payload))
+
+        info2 = {"id": "video-2", "title": "Example 2"}
+        logger.set_video("video-2")
+        try:
+            logger.error("This video is private")
+        finally:
+            logger.set_video(None)
+
+        hook({"status": "finished", "info_dict": info2})
+
+        info3 = {"id": "video-3", "title": "Example 3"}
+        try:
+            hook(
+                {
+                    "status": "error",
+                    "info_dict": info3,
+                    "error": "PO token required for playback",
+                }
+            )
+        except dc.DownloadCancelled:
+            pytest.fail("consecutive failures should have reset after success")
 
-    monkeypatch.setattr(dc.yt_dlp, "YoutubeDL", FakeYoutubeDL)
+    _install_fake_ydl(monkeypatch, fake_download)
 
     attempt = dc.run_download_attempt(
         ["https://www.youtube.com/watch?v=example"],
@@ -563,46 +512,36 @@ def test_run_download_attempt_consecutive_resets_after_success(
 
 
 def test_run_download_attempt_total_limit_without_consecutive_streak(
-    monkeypatch: pytest.MonkeyPatch, capsys
+    make_args, monkeypatch: pytest.MonkeyPatch, capsys
 ) -> None:
     args = make_args(failure_limit=3)
     limit = args.failure_limit
 
-    class FakeYoutubeDL:
-        def __init__(self, params):
-            self.params = params
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
+    def fake_download(fake, urls):
+        assert urls == ["https://www.youtube.com/watch?v=example"]
+        hooks = fake.params.get("progress_hooks") or []
+        assert hooks, "Expected at least one progress hook"
+        hook = hooks[0]
 
-        def download(self, urls):
-            assert urls == ["https://www.youtube.com/watch?v=example"]
-            hooks = self.params.get("progress_hooks") or []
-            assert hooks, "Expected at least one progress hook"
-            hook = hooks[0]
-
-            for idx in range(limit):
-                video_id = f"video-{idx}"
-                info = {"id": video_id, "title": f"Example {idx}"}
-                error_payload = {
-                    "status": "error",
-                    "info_dict": info,
-                    "error": "HTTP Error 403: Forbidden",
-                }
-                try:
-                    hook(dict(error_payload))
-                except dc.DownloadCancelled:
-                    if idx != limit - 1:
-                        pytest.fail("failure limit triggered before total cap")
-                    raise
+        for idx in range(limit):
+            video_id = f"video-{idx}"
+            info = {"id": video_id, "title": f"Example {idx}"}
+            error_payload = {
+                "status": "error",
+                "info_dict": info,
+                "error": "PO token required for playback",
+            }
+            try:
+                hook(error_payload.copy())
+            except dc.DownloadCancelled:
+                if idx != limit - 1:
+                    pytest.fail("failure limit triggered before total cap")
+                raise
 
-                if idx < limit - 1:
-                    hook({"status": "finished", "info_dict": info})
+            if idx < limit - 1:
+                hook({"status": "finished", "info_dict": info})
 
-    monkeypatch.setattr(dc.yt_dlp, "YoutubeDL", FakeYoutubeDL)
+    _install_fake_ydl(monkeypatch, fake_download)
 
     attempt = dc.run_download_attempt(
         ["https://www.youtube.com/watch?v=example"],
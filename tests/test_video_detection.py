@@ -1,40 +1,12 @@
 from __future__ import annotations
 
 import re
-from types import SimpleNamespace
 from typing import Optional
 
 import pytest
 
-import download_channel_videos as dc
-
-
-def make_args(**overrides):
-    defaults = {
-        "output": "downloads",
-        "skip_thumbs": False,
-        "skip_subtitles": False,
-        "archive": "archive.txt",
-        "rate_limit": None,
-        "concurrency": None,
-        "since": None,
-        "until": None,
-        "cookies_from_browser": None,
-        "sleep_requests": None,
-        "sleep_interval": None,
-        "max_sleep_interval": None,
-        "allow_restricted": False,
-        "youtube_client": None,
-        "youtube_fetch_po_token": None,
-        "youtube_po_token": [],
-        "youtube_player_params": None,
-        "no_shorts": False,
-        "max": None,
-    }
-    defaults.update(overrides)
-    args = SimpleNamespace(**defaults)
-    dc.apply_authentication_defaults(args, environ={})
-    return args
+import youtube_dl.downloader as dc
+from youtube_dl.metadata import _collect_video_ids_from_info
 
 
 def test_collect_video_ids_from_info_handles_nested_entries() -> None:
@@ -49,7 +21,7 @@ def test_collect_video_ids_from_info_handles_nested_entries() -> None:
     }
 
     dest: list[dc.VideoMetadata] = []
-    dc._collect_video_ids_from_info(info, dest)
+    _collect_video_ids_from_info(info, dest)
 
     assert dest == [
         dc.VideoMetadata("video-1", None),
@@ -58,8 +30,8 @@ def test_collect_video_ids_from_info_handles_nested_entries() -> None:
     ]
 
 
-def test_collect_all_video_ids_uses_metadata_without_archive(monkeypatch: pytest.MonkeyPatch) -> None:
-    args = make_args()
+def test_collect_all_video_ids_uses_metadata_without_archive(make_args, monkeypatch: pytest.MonkeyPatch) -> None:
+    args = make_args(archive="archive.txt")
     captured_opts = {}
 
     class DummyYDL:
@@ -88,10 +60,10 @@ def test_collect_all_video_ids_uses_metadata_without_archive(monkeypatch: pytest
 
 
 def test_download_source_summary_includes_metadata_count(
-    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    make_args, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
 ) -> None:
     source = dc.Source(dc.SourceType.CHANNEL, "https://www.youtube.com/@Example")
-    args = make_args()
+    args = make_args(archive="archive.txt")
 
     monkeypatch.setattr(dc, "DEFAULT_PLAYER_CLIENTS", ("tv",))
     monkeypatch.setattr(
@@ -1,6 +1,7 @@
 """Download archive management for tracking downloaded videos."""
 
 import contextlib
+import mmap
 import os
 import sys
 from typing import Iterable, Optional, Set
@@ -11,15 +12,15 @@ def load_download_archive(path: Optional[str]) -> Set[str]:
     if not path:
         return set()
 
+    # Map the file and split once in C instead of a per-line Python loop
+    # with per-line decoding; archives grow to 100k+ ids over time.
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            entries = set()
-            for raw_line in handle:
-                stripped = raw_line.strip()
-                if not stripped or stripped.startswith("#"):
-                    continue
-                entries.add(stripped)
-            return entries
+        with open(path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size == 0:
+                return set()
+            with mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+                raw = mapped[:]
     except FileNotFoundError:
         return set()
     except OSError as exc:
@@ -29,6 +30,12 @@ def load_download_archive(path: Optional[str]) -> Set[str]:
         )
         return set()
 
+    return {
+        stripped.decode("utf-8")
+        for line in raw.split(b"\n")
+        if (stripped := line.strip()) and not stripped.startswith(b"#")
+    }
+
 
 def write_download_archive(path: Optional[str], video_ids: Iterable[str]) -> None:
     """Write video IDs to the download archive file."""
@@ -65,6 +72,90 @@ def write_download_archive(path: Optional[str], video_ids: Iterable[str]) -> Non
             os.remove(temp_path)
 
 
+class ArchiveAppender:
+    """Buffered appender for the download archive.
+
+    Collects video IDs in a byte buffer and writes them to the archive in
+    batches, so a steady stream of completions issues one write per ~64 KiB
+    instead of an open/write/close cycle per video. Call ``close`` (or
+    ``flush``) at the end of a download attempt to persist anything still
+    buffered.
+    """
+
+    FLUSH_THRESHOLD = 64 * 1024
+
+    def __init__(self, path: Optional[str]) -> None:
+        self._path = path
+        self._buffer = bytearray()
+        self._fd: Optional[int] = None
+
+    def append(self, video_id: Optional[str]) -> None:
+        """Queue a video ID for appending; flushes when the buffer fills."""
+        if not self._path or not video_id:
+            return
+
+        sanitized = str(video_id).strip()
+        if not sanitized:
+            return
+
+        self._buffer += f"{sanitized}\n".encode("utf-8")
+        if len(self._buffer) >= self.FLUSH_THRESHOLD:
+            self.flush()
+
+    def _ensure_fd(self) -> Optional[int]:
+        if self._fd is not None:
+            return self._fd
+
+        directory = os.path.dirname(self._path)
+        if directory:
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError as exc:
+                print(
+                    f"Warning: Failed to create directory for archive {self._path}: {exc}",
+                    file=sys.stderr,
+                )
+                return None
+
+        try:
+            self._fd = os.open(
+                self._path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+            )
+        except OSError as exc:
+            print(
+                f"Warning: Failed to open download archive {self._path}: {exc}",
+                file=sys.stderr,
+            )
+            return None
+        return self._fd
+
+    def flush(self) -> None:
+        """Write any buffered IDs to the archive file."""
+        if not self._buffer:
+            return
+
+        fd = self._ensure_fd()
+        if fd is None:
+            return
+
+        try:
+            os.write(fd, bytes(self._buffer))
+            self._buffer.clear()
+        except OSError as exc:
+            print(
+                f"Warning: Failed to append to download archive {self._path}: {exc}",
+                file=sys.stderr,
+            )
+
+    def close(self) -> None:
+        """Flush buffered IDs and release the file handle."""
+        self.flush()
+        if self._fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+            self._fd = None
+
+
 def append_to_download_archive(path: Optional[str], video_id: Optional[str]) -> None:
     """Append a single video ID to the download archive."""
     if not path or not video_id:
@@ -5,7 +5,7 @@ import json
 import os
 import re
 import sys
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional
 
 from .models import (
     BGUTIL_PROVIDER_CHOICES,
@@ -297,13 +297,10 @@ def parse_args() -> argparse.Namespace:
 
 
 def _parse_po_token_env(value: str) -> List[str]:
-    """Parse PO tokens from environment variable."""
-    tokens: List[str] = []
-    for part in re.split(r"[\n,]+", value):
-        cleaned = part.strip()
-        if cleaned:
-            tokens.append(cleaned)
-    return tokens
+    """Parse PO tokens from environment variable (deduplicated, order kept)."""
+    return list(
+        dict.fromkeys(part.strip() for part in re.split(r"[\n,]+", value) if part.strip())
+    )
 
 
 def _normalize_env_str(value: Optional[str]) -> Optional[str]:
@@ -406,14 +403,8 @@ def apply_authentication_defaults(args, environ: Optional[Dict[str, str]] = None
 
     existing_tokens = list(getattr(args, "youtube_po_token", []) or [])
     if parsed_tokens:
-        merged_tokens = existing_tokens + parsed_tokens
-        seen: Set[str] = set()
-        unique_tokens: List[str] = []
-        for token in merged_tokens:
-            if token not in seen:
-                seen.add(token)
-                unique_tokens.append(token)
-        args.youtube_po_token = unique_tokens
+        # dict.fromkeys dedups in one pass while keeping first-seen order
+        args.youtube_po_token = list(dict.fromkeys(existing_tokens + parsed_tokens))
     elif not existing_tokens:
         args.youtube_po_token = existing_tokens
 
@@ -6,19 +6,23 @@ import re
 import sys
 import time
 import urllib.parse
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Set
 
 import yt_dlp
 from yt_dlp.utils import DownloadCancelled, DownloadError, ExtractorError
 
-from .archive import append_to_download_archive
-from .errors import ErrorAnalyzer
+from .archive import ArchiveAppender
+from .archive import load_download_archive as _load_download_archive
+from .archive import write_download_archive as _write_download_archive
+from .errors import YTDLP_SAID_MARKER, ErrorAnalyzer, classify_error
 from .logger import DownloadLogger
 from .metadata import collect_all_video_ids
+from .negative_cache import NegativeCache
 from .models import (
     DEFAULT_FAILURE_LIMIT,
     DEFAULT_PLAYER_CLIENTS,
     MAX_ATTEMPTS_PER_CLIENT,
+    PLAYER_CLIENT_CHOICES,
     DownloadAttempt,
     Source,
     SourceType,
@@ -56,22 +60,26 @@ def format_attempt_summary(attempt: DownloadAttempt) -> str:
 
 
 def summarize_source_label(source: Source, display_url: str) -> str:
-    """Generate a short label for a source."""
+    """Generate a short label for a source.
+
+    Cheap substring guards front the regex/urlparse work so URLs without the
+    relevant markers fall straight through to the display URL.
+    """
     if source.kind is SourceType.CHANNEL:
-        handle_match = re.search(r"/(@[^/]+)", display_url)
-        if handle_match:
-            return handle_match.group(1)
-        channel_match = re.search(r"/channel/([^/?]+)", display_url)
-        if channel_match:
-            return f"channel {channel_match.group(1)}"
-    if source.kind is SourceType.PLAYLIST:
-        parsed = urllib.parse.urlparse(display_url)
-        if parsed.query:
-            return f"playlist {parsed.query}"
-    if source.kind is SourceType.VIDEO:
-        parsed = urllib.parse.urlparse(display_url)
-        if parsed.query:
-            return f"video {parsed.query}"
+        if "@" in display_url:
+            handle_match = re.search(r"/(@[^/]+)", display_url)
+            if handle_match:
+                return handle_match.group(1)
+        if "/channel/" in display_url:
+            channel_match = re.search(r"/channel/([^/?]+)", display_url)
+            if channel_match:
+                return f"channel {channel_match.group(1)}"
+    elif source.kind is SourceType.PLAYLIST or source.kind is SourceType.VIDEO:
+        if "?" in display_url:
+            parsed = urllib.parse.urlparse(display_url)
+            if parsed.query:
+                kind_name = "playlist" if source.kind is SourceType.PLAYLIST else "video"
+                return f"{kind_name} {parsed.query}"
     return display_url
 
 
@@ -322,7 +330,9 @@ def run_download_attempt(
                 details.append(f"formats: {format_text}")
             if fragment_url:
                 details.append(f"fragment: {fragment_url}")
-            details.append(f"yt-dlp said: {error_message}")
+            details.append(YTDLP_SAID_MARKER + error_message)
+            if negative_cache is not None and video_id:
+                negative_cache.mark(video_id, classify_error(error_message[:128]))
             logger.set_video(video_id)
             try:
                 logger.error(" | ".join(details))
@@ -351,7 +361,7 @@ def run_download_attempt(
                 video_labels.pop(info_id, None)
                 completed_ids.add(info_id)
                 if not already_seen:
-                    _append_to_download_archive(args.archive, info_id)
+                    archive_appender.append(info_id)
             downloaded += 1
             if max_total and downloaded >= max_total:
                 stopped_due_to_limit = True
@@ -371,6 +381,33 @@ def run_download_attempt(
 
     extra_filters.append(match_filter)
 
+    # Skip videos already known to be dead: permanent marks always,
+    # temporary marks only from previous runs. One instance is shared
+    # across a run's client attempts (cached on args like the proxy
+    # pool), so an id marked temporarily by one attempt is still retried
+    # by the fallback clients and only persisted for future runs.
+    # Disabled with --allow-restricted, which exists to force retries on
+    # gated content.
+    negative_cache: Optional[NegativeCache] = None
+    if not getattr(args, "allow_restricted", False):
+        negative_cache = getattr(args, "_negative_cache", None)
+        if negative_cache is None:
+            negative_cache = NegativeCache(getattr(args, "output", None))
+            args._negative_cache = negative_cache
+            if len(negative_cache):
+                print(
+                    f"Negative cache: skipping {len(negative_cache)} known-unavailable"
+                    f" video{'s' if len(negative_cache) != 1 else ''}."
+                )
+
+        def dead_video_filter(info_dict: dict) -> Optional[str]:
+            video_id = info_dict.get("id") if isinstance(info_dict, dict) else None
+            if video_id and video_id in negative_cache:
+                return "Video previously marked unavailable (negative cache)"
+            return None
+
+        extra_filters.append(dead_video_filter)
+
     if target_video_ids:
 
         def retry_allowlist(info_dict: dict) -> Optional[str]:
@@ -385,6 +422,10 @@ def run_download_attempt(
 
     ydl_opts = build_ydl_options(args, player_client, logger, hook, extra_filters)
 
+    # Batch archive appends through one handle instead of an open/write/close
+    # per completed video; the finally below persists anything still buffered.
+    archive_appender = ArchiveAppender(args.archive)
+
     try:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             for u in urls:
@@ -476,6 +517,10 @@ def run_download_attempt(
             raise
     except DownloadCancelled:
         failure_limit_reached = True
+    finally:
+        archive_appender.close()
+        if negative_cache is not None:
+            negative_cache.save()
 
     return DownloadAttempt(
         downloaded=downloaded,
@@ -483,7 +528,7 @@ def run_download_attempt(
         other_errors=logger.other_errors,
         detected_video_ids=set(detected_ids),
         downloaded_video_ids=set(completed_ids),
-        retryable_error_ids=set(logger.retryable_error_ids),
+        retryable_error_ids=frozenset(logger.retryable_error_ids),
         stopped_due_to_limit=stopped_due_to_limit,
         failure_count=consecutive_failures,
         total_failure_count=total_failures,
@@ -525,9 +570,11 @@ def download_source(source: Source, args) -> None:
 
     archive_path = getattr(args, "archive", None)
     downloaded_ids: Set[str] = set()
+    last_compaction_size = 0
     if archive_path:
         previously_downloaded = _load_download_archive(archive_path)
         downloaded_ids.update(previously_downloaded)
+        last_compaction_size = len(previously_downloaded)
         if os.path.exists(archive_path):
             if previously_downloaded:
                 print(
@@ -551,7 +598,7 @@ def download_source(source: Source, args) -> None:
         )
     detected_ids: Set[str] = {entry.video_id for entry in metadata_video_entries}
     downloaded_in_session: Set[str] = set()
-    pending_retry_ids: Optional[Set[str]] = None
+    pending_retry_ids: Optional[FrozenSet[str]] = None
     total_downloaded = 0
     total_unavailable = 0
     total_other_errors = 0
@@ -591,8 +638,19 @@ def download_source(source: Source, args) -> None:
             and consecutive_failures < MAX_ATTEMPTS_PER_CLIENT
         ):
             target_ids = pending_retry_ids if pending_retry_ids else None
+            attempt_urls = urls
+            if target_ids:
+                # A retry attempt only needs the flagged videos, so hand
+                # yt-dlp direct watch URLs instead of the original source
+                # URLs; that skips re-enumerating the whole channel or
+                # playlist, which is where most of a retry's wall clock
+                # goes. The target id filter stays in place as a guard.
+                attempt_urls = [
+                    f"https://www.youtube.com/watch?v={video_id}"
+                    for video_id in sorted(target_ids)
+                ]
             result = run_download_attempt(
-                urls,
+                attempt_urls,
                 args,
                 client,
                 max_total,
@@ -611,7 +669,13 @@ def download_source(source: Source, args) -> None:
             detected_ids.update(result.detected_video_ids)
             downloaded_in_session.update(result.downloaded_video_ids)
             if archive_path and result.downloaded_video_ids:
-                _write_download_archive(archive_path, downloaded_ids)
+                # New ids were already appended in place by the attempt's
+                # ArchiveAppender; only rewrite the whole file once it has
+                # roughly doubled since the last compaction, so the O(N)
+                # rewrite stays rare instead of running after every attempt.
+                if len(downloaded_ids) > 2 * max(last_compaction_size, 1):
+                    _write_download_archive(archive_path, downloaded_ids)
+                    last_compaction_size = len(downloaded_ids)
                 archive_updated = True
 
             # Track session telemetry
@@ -670,7 +734,10 @@ def download_source(source: Source, args) -> None:
 
             if result.retryable_error_ids:
                 if next_client_available:
-                    pending_retry_ids = set(result.retryable_error_ids)
+                    # frozenset() over an existing frozenset is a ref bump,
+                    # not a copy, so the retry target list costs nothing to
+                    # hand to the next attempt.
+                    pending_retry_ids = frozenset(result.retryable_error_ids)
                     next_client = client_attempts[idx + 1]
                     retry_count = len(pending_retry_ids)
                     plural = "video" if retry_count == 1 else "videos"
@@ -885,6 +952,12 @@ def download_videos_from_urls(video_urls: List[str], args) -> None:
     total_downloaded = 0
     total_failed = 0
 
+    # Build the per-video args template once instead of copying the whole
+    # namespace on every iteration; only `max` differs from the caller's args
+    # and it stays constant across the loop.
+    temp_args = argparse.Namespace(**vars(args))
+    temp_args.max = 1  # Download only one video per call
+
     # Download each video
     for idx, url in enumerate(filtered_urls, start=1):
         print(f"\n[{idx}/{len(filtered_urls)}] Downloading {url}")
@@ -894,10 +967,6 @@ def download_videos_from_urls(video_urls: List[str], args) -> None:
             video_source = Source(kind=SourceType.VIDEO, url=url)
 
             # Use download_source to leverage existing download logic
-            # We'll create a temporary args copy to avoid max limit issues
-            temp_args = argparse.Namespace(**vars(args))
-            temp_args.max = 1  # Download only this one video
-
             download_source(video_source, temp_args)
             total_downloaded += 1
 
@@ -1,11 +1,49 @@
 """Error analysis and exception handling for YouTube downloader."""
 
+import functools
 import sys
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional
 
 from .models import ErrorPattern
 
+# Prefix the progress hook puts in front of the raw yt-dlp text when it
+# builds its composite error messages; classification strips everything
+# before it so the video label and format details cannot push the actual
+# error past the classified prefix.
+YTDLP_SAID_MARKER = "yt-dlp said: "
+
+
+@functools.lru_cache(maxsize=1024)
+def classify_error(message_prefix: str) -> str:
+    """Categorize an error message prefix into a known pattern name.
+
+    Pure function, cached: the same yt-dlp error text recurs for every
+    affected video (modulo the video ID, which sits past the prefix), so
+    repeated substring scans collapse into one dict lookup.
+    """
+    lowered = message_prefix.lower()
+
+    # Categorize the error (order matters - more specific first)
+    if any(x in lowered for x in ["not available in your country", "geo", "region"]):
+        return "geo_restricted"
+    if any(x in lowered for x in ["age", "sign in to confirm"]):
+        return "age_restricted"
+    if any(x in lowered for x in ["members only", "member", "subscription", "subscriber"]):
+        return "members_only"
+    if any(x in lowered for x in ["private", "deleted", "removed", "uploader has not made"]):
+        return "private_deleted"
+    if any(x in lowered for x in ["video unavailable", "content isn't available", "content is not available", "this content isn't available"]):
+        return "video_unavailable"
+    if any(x in lowered for x in ["403", "forbidden", "too many requests", "rate limit"]):
+        return "rate_limit"
+    if any(x in lowered for x in ["po token", "po_token"]):
+        return "po_token"
+    if any(x in lowered for x in ["login required", "authentication"]):
+        return "auth_required"
+    return "unknown"
+
 
 class ErrorAnalyzer:
     """Analyzes error patterns and suggests remediation strategies."""
@@ -24,6 +62,9 @@ class ErrorAnalyzer:
         }
         self.total_errors = 0
         self.error_log_path: Optional[str] = None
+        # One analyzer is shared across scan worker threads; counter and
+        # pattern updates happen under this lock.
+        self._lock = threading.Lock()
 
     def set_error_log_path(self, path: str) -> None:
         """Set the path for the detailed error log file."""
@@ -31,32 +72,23 @@ class ErrorAnalyzer:
 
     def categorize_and_record(self, video_id: Optional[str], error_message: str) -> str:
         """Categorize an error and record it. Returns the error category."""
-        self.total_errors += 1
-        lowered = error_message.lower()
-
-        category = "unknown"
-
-        # Categorize the error (order matters - more specific first)
-        if any(x in lowered for x in ["not available in your country", "geo", "region"]):
-            category = "geo_restricted"
-        elif any(x in lowered for x in ["age", "sign in to confirm"]):
-            category = "age_restricted"
-        elif any(x in lowered for x in ["members only", "member", "subscription", "subscriber"]):
-            category = "members_only"
-        elif any(x in lowered for x in ["private", "deleted", "removed", "uploader has not made"]):
-            category = "private_deleted"
-        elif any(x in lowered for x in ["video unavailable", "content isn't available", "content is not available", "this content isn't available"]):
-            category = "video_unavailable"
-        elif any(x in lowered for x in ["403", "forbidden", "too many requests", "rate limit"]):
-            category = "rate_limit"
-        elif any(x in lowered for x in ["po token", "po_token"]):
-            category = "po_token"
-        elif any(x in lowered for x in ["login required", "authentication"]):
-            category = "auth_required"
+        # Hook-built messages lead with the video label and format details;
+        # classify only what yt-dlp actually said.
+        marker = error_message.rfind(YTDLP_SAID_MARKER)
+        relevant = (
+            error_message[marker + len(YTDLP_SAID_MARKER):]
+            if marker != -1
+            else error_message
+        )
+
+        # Classify on a bounded prefix so the memoization key stays small;
+        # the category keywords sit at the front of yt-dlp error messages.
+        category = classify_error(relevant[:128])
 
         # Record the error
-        pattern = self.patterns[category]
-        pattern.record(video_id, error_message)
+        with self._lock:
+            self.total_errors += 1
+            self.patterns[category].record(video_id, error_message)
 
         # Log to error file if configured
         if self.error_log_path:
@@ -3,7 +3,8 @@
 import re
 import sys
 import time
-from typing import Callable, List, Optional, Set, Tuple
+from collections import deque
+from typing import Callable, Deque, Dict, KeysView, List, Optional, Tuple
 
 from .errors import ErrorAnalyzer
 
@@ -40,6 +41,22 @@ class DownloadLogger:
 
     YOUTUBE_ID_PATTERN = re.compile(r"\[youtube[^\]]*\]\s+([0-9A-Za-z_-]{11})")
 
+    # The fragment tuples above stay the source of truth; all three are
+    # compiled into one alternation with a named group per category, so
+    # classifying a message is a single regex pass instead of up to three
+    # separate scans. Messages are lowercased before matching, so no
+    # IGNORECASE is needed.
+    _FRAGMENT_RE = re.compile(
+        "|".join(
+            f"(?P<{name}>" + "|".join(map(re.escape, fragments)) + ")"
+            for name, fragments in (
+                ("ignored", IGNORED_FRAGMENTS),
+                ("unavailable", UNAVAILABLE_FRAGMENTS),
+                ("retryable", RETRYABLE_FRAGMENTS),
+            )
+        )
+    )
+
     def __init__(
         self,
         failure_callback: Optional[Callable[[Optional[str]], None]] = None,
@@ -51,7 +68,9 @@ class DownloadLogger:
         self.current_url: Optional[str] = None
         self.current_client: Optional[str] = None
         self.current_video_id: Optional[str] = None
-        self.retryable_error_ids: Set[str] = set()
+        # Stored as a dict keyed by id: smaller per-entry overhead than a
+        # set in CPython and insertion-ordered; exposed as a set-like view.
+        self._retryable_ids: Dict[str, None] = {}
         self._failure_callback = failure_callback
         self._detection_callback = detection_callback
         self._error_analyzer = error_analyzer
@@ -59,8 +78,31 @@ class DownloadLogger:
         # Track 403 errors for rate limit detection
         self.http_403_count = 0
         self.http_403_timestamps: List[float] = []
-        # Track "video unavailable" errors for rate limit detection
-        self.unavailable_timestamps: List[float] = []
+        # Track "video unavailable" errors for rate limit detection; a deque
+        # so expiring old entries is popleft instead of rebuilding a list
+        self.unavailable_timestamps: Deque[float] = deque()
+
+    def reset(self) -> None:
+        """Reset counters and per-run state in place, keeping callbacks.
+
+        Lets a long-lived logger be reused across runs without paying for
+        reconstruction.
+        """
+        self.video_unavailable_errors = 0
+        self.other_errors = 0
+        self.current_url = None
+        self.current_client = None
+        self.current_video_id = None
+        self._retryable_ids.clear()
+        self._last_reported_failure = None
+        self.http_403_count = 0
+        self.http_403_timestamps.clear()
+        self.unavailable_timestamps.clear()
+
+    @property
+    def retryable_error_ids(self) -> KeysView[str]:
+        """Set-like view of video ids that hit retryable errors."""
+        return self._retryable_ids.keys()
 
     def set_failure_callback(
         self, callback: Optional[Callable[[Optional[str]], None]]
@@ -109,14 +151,14 @@ class DownloadLogger:
         Check if we're seeing too many "video unavailable" errors in a short time window.
         Returns True if we should pause for rate limiting (3+ errors in 10 seconds).
         """
-        if len(self.unavailable_timestamps) < 3:
-            return False
-
-        # Check if we have 3+ unavailable errors in the last 10 seconds
+        # Drop entries older than the 10-second window from the left;
+        # timestamps arrive in order, so this is amortized O(1) per error
         recent_window = time.time() - 10
-        recent_unavailable = sum(1 for ts in self.unavailable_timestamps if ts > recent_window)
+        stamps = self.unavailable_timestamps
+        while stamps and stamps[0] <= recent_window:
+            stamps.popleft()
 
-        return recent_unavailable >= 3
+        return len(stamps) >= 3
 
     def set_video(self, video_id: Optional[str]) -> None:
         if video_id != self.current_video_id:
@@ -146,8 +188,19 @@ class DownloadLogger:
             True if the message should be printed, False if it should be suppressed.
         """
         lowered = text.lower()
-        if any(fragment in lowered for fragment in self.IGNORED_FRAGMENTS):
-            return False
+
+        # One pass sets every category flag; an ignored fragment anywhere
+        # in the message suppresses it outright.
+        is_unavailable = False
+        is_retryable = False
+        for fragment in self._FRAGMENT_RE.finditer(lowered):
+            kind = fragment.lastgroup
+            if kind == "ignored":
+                return False
+            if kind == "unavailable":
+                is_unavailable = True
+            else:
+                is_retryable = True
 
         parsed_video_id: Optional[str] = None
         match = self.YOUTUBE_ID_PATTERN.search(text)
@@ -159,10 +212,6 @@ class DownloadLogger:
         if self._detection_callback and video_id:
             self._detection_callback(video_id)
 
-        is_retryable = any(
-            fragment in lowered for fragment in self.RETRYABLE_FRAGMENTS
-        )
-
         # Track HTTP 403 errors specifically for rate limit detection
         if "http error 403" in lowered or "forbidden" in lowered:
             self.http_403_count += 1
@@ -171,13 +220,15 @@ class DownloadLogger:
             cutoff_time = time.time() - 600
             self.http_403_timestamps = [ts for ts in self.http_403_timestamps if ts > cutoff_time]
 
-        if any(fragment in lowered for fragment in self.UNAVAILABLE_FRAGMENTS):
+        if is_unavailable:
             self.video_unavailable_errors += 1
             # Track timestamp for rate limiting detection
-            self.unavailable_timestamps.append(time.time())
+            now = time.time()
+            self.unavailable_timestamps.append(now)
             # Keep only recent timestamps (last 60 seconds)
-            cutoff_time = time.time() - 60
-            self.unavailable_timestamps = [ts for ts in self.unavailable_timestamps if ts > cutoff_time]
+            cutoff_time = now - 60
+            while self.unavailable_timestamps[0] <= cutoff_time:
+                self.unavailable_timestamps.popleft()
 
             # Record in error analyzer if available
             if self._error_analyzer:
@@ -197,7 +248,7 @@ class DownloadLogger:
 
         if is_retryable:
             if video_id:
-                self.retryable_error_ids.add(video_id)
+                self._retryable_ids[video_id] = None
             # Record retryable errors in analyzer
             if self._error_analyzer:
                 self._error_analyzer.categorize_and_record(video_id, text)
@@ -4,7 +4,7 @@ import random
 import sys
 import time
 from datetime import datetime
-from typing import Iterable, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import yt_dlp
 from yt_dlp.utils import DownloadError, ExtractorError
@@ -14,6 +14,45 @@ from .logger import DownloadLogger
 from .models import DEFAULT_PLAYER_CLIENTS, USER_AGENTS, VideoMetadata
 
 
+# Distilled playlist metadata keyed by URL. A full channel/playlist walk is
+# the most expensive network operation in a scan, and the same URL is
+# re-scanned on client fallbacks, watch-loop reloads and repeated sources;
+# within the TTL we reuse the collected entries instead of re-extracting.
+# Only the VideoMetadata list is kept — never the raw extract_info tree,
+# which can run to hundreds of MB across a large scan — and the cache is
+# bounded: storing sweeps expired entries and evicts the oldest once full.
+_PLAYLIST_CACHE: Dict[str, Tuple[float, List[VideoMetadata]]] = {}
+_PLAYLIST_CACHE_TTL = 600.0  # seconds
+_PLAYLIST_CACHE_MAX_ENTRIES = 64
+
+
+def _get_cached_playlist(url: str) -> Optional[List[VideoMetadata]]:
+    """Return the cached video entries for *url* if still fresh."""
+    cached = _PLAYLIST_CACHE.get(url)
+    if cached is None:
+        return None
+    fetched_at, entries = cached
+    if time.monotonic() - fetched_at > _PLAYLIST_CACHE_TTL:
+        del _PLAYLIST_CACHE[url]
+        return None
+    return entries
+
+
+def _store_cached_playlist(url: str, entries: List[VideoMetadata]) -> None:
+    now = time.monotonic()
+    expired = [
+        key
+        for key, (fetched_at, _) in _PLAYLIST_CACHE.items()
+        if now - fetched_at > _PLAYLIST_CACHE_TTL
+    ]
+    for key in expired:
+        del _PLAYLIST_CACHE[key]
+    # Dicts iterate in insertion order, so the first key is the oldest.
+    while len(_PLAYLIST_CACHE) >= _PLAYLIST_CACHE_MAX_ENTRIES:
+        del _PLAYLIST_CACHE[next(iter(_PLAYLIST_CACHE))]
+    _PLAYLIST_CACHE[url] = (now, entries)
+
+
 def _log_with_timestamp(message: str) -> None:
     """Print a log message with timestamp."""
     timestamp = datetime.now().strftime("%H:%M:%S")
@@ -28,65 +67,77 @@ def _collect_video_ids_from_info(
     log_progress: bool = False,
 ) -> int:
     """
-    Recursively extract video identifiers from yt-dlp metadata objects.
-    Returns the number of new videos found in this call.
+    Extract video identifiers from yt-dlp metadata objects.
+
+    Nested playlists are walked with an explicit stack instead of
+    recursion, so a channel listing with thousands of entries pays one
+    Python frame total rather than one per entry. Returns the number of
+    new videos found in this call.
     """
 
     if seen is None:
         seen = set()
 
-    if info is None:
-        return 0
-
-    if isinstance(info, list):
-        count = 0
-        for entry in info:
-            count += _collect_video_ids_from_info(entry, dest, seen, log_progress)
-        return count
-
-    if not isinstance(info, dict):
-        return 0
-
-    info_type = info.get("_type")
-
-    if info_type in {"playlist", "multi_video", "compat_list"}:
-        entries = info.get("entries") or []
-        return _collect_video_ids_from_info(entries, dest, seen, log_progress)
+    count = 0
+    # Children are pushed reversed so the walk stays depth-first,
+    # left-to-right like the old recursion and dest keeps its order.
+    stack: List[object] = [info]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+
+        if not isinstance(node, dict):
+            continue
+
+        info_type = node.get("_type")
+
+        if info_type in {"playlist", "multi_video", "compat_list"} or (
+            info_type == "url" and "entries" in node
+        ):
+            entries = node.get("entries") or []
+            if isinstance(entries, list):
+                stack.extend(reversed(entries))
+            else:
+                stack.append(entries)
+            continue
 
-    if info_type == "url" and "entries" in info:
-        return _collect_video_ids_from_info(info.get("entries"), dest, seen, log_progress)
+        video_id = node.get("id")
+        if not video_id:
+            continue
 
-    video_id = info.get("id")
-    if video_id:
         video_id_str = str(video_id)
-        if video_id_str not in seen:
-            seen.add(video_id_str)
-            title = info.get("title")
-            title_str = title if isinstance(title, str) else None
-            dest.append(VideoMetadata(video_id=video_id_str, title=title_str))
-
-            # Enhanced per-video progress logging
+        if video_id_str in seen:
+            # Video already seen (duplicate)
             if log_progress:
-                video_count = len(dest)
+                _log_with_timestamp(f"[video] ⏭ Skipping duplicate: {video_id_str}")
+            continue
 
-                # Log every 10 videos for more granular progress tracking
-                if video_count % 10 == 0:
-                    # Show title preview for every 10th video
-                    title_preview = (title_str[:50] + '...') if title_str and len(title_str) > 50 else (title_str or '(no title)')
-                    _log_with_timestamp(f"[video] 📹 Collected {video_count} videos | Latest: {title_preview}")
+        seen.add(video_id_str)
+        title = node.get("title")
+        title_str = title if isinstance(title, str) else None
+        dest.append(VideoMetadata(video_id=video_id_str, title=title_str))
+        count += 1
 
-                # Show milestone markers for larger numbers
-                elif video_count in [25, 75, 125, 175, 250, 500, 750, 1000, 2000, 5000]:
-                    _log_with_timestamp(f"[video] ✓ Progress milestone: {video_count} videos collected")
+        # Enhanced per-video progress logging
+        if log_progress:
+            video_count = len(dest)
 
-            return 1
-        else:
-            # Video already seen (duplicate)
-            if log_progress:
-                _log_with_timestamp(f"[video] ⏭ Skipping duplicate: {video_id_str}")
-            return 0
+            # Log every 10 videos for more granular progress tracking
+            if video_count % 10 == 0:
+                # Show title preview for every 10th video
+                title_preview = (title_str[:50] + '...') if title_str and len(title_str) > 50 else (title_str or '(no title)')
+                _log_with_timestamp(f"[video] 📹 Collected {video_count} videos | Latest: {title_preview}")
+
+            # Show milestone markers for larger numbers
+            elif video_count in [25, 75, 125, 175, 250, 500, 750, 1000, 2000, 5000]:
+                _log_with_timestamp(f"[video] ✓ Progress milestone: {video_count} videos collected")
 
-    return 0
+    return count
 
 
 def collect_all_video_ids(
@@ -152,6 +203,23 @@ def collect_all_video_ids(
             _log_with_timestamp(f"[url-scan] URL type: {url_suffix}")
             _log_with_timestamp(f"[url-scan] Full URL: {url}")
 
+            # Serve from the metadata cache when possible; skips both the
+            # extraction and the rate-limit delay since no request is made.
+            cached_entries = _get_cached_playlist(url)
+            if cached_entries is not None:
+                _log_with_timestamp(f"[extract] ✓ Reusing cached metadata for this URL")
+                new_videos = 0
+                for entry in cached_entries:
+                    if entry.video_id not in seen_ids:
+                        seen_ids.add(entry.video_id)
+                        video_metadata.append(entry)
+                        new_videos += 1
+                _log_with_timestamp(f"[extract] ✓ Found {new_videos} video(s) from cache")
+                _log_with_timestamp(f"[url-scan] ✓ Successfully completed URL {idx+1}/{total_urls}")
+                consecutive_failures = 0
+                current_delay = base_delay
+                continue
+
             # Add delay between metadata requests to avoid rate limiting
             if idx > 0:
                 # Add random jitter (±20%) to avoid predictable patterns
@@ -236,6 +304,7 @@ def collect_all_video_ids(
 
                         new_videos = _collect_video_ids_from_info(info, video_metadata, seen_ids, log_progress=True)
                         videos_after = len(video_metadata)
+                        _store_cached_playlist(url, video_metadata[videos_before:videos_after])
                         duplicates_found = new_videos - (videos_after - videos_before) if new_videos > 0 else 0
 
                         _log_with_timestamp(f"[extract] ✓ Found {new_videos} video(s) from this URL")
@@ -258,7 +327,7 @@ def collect_all_video_ids(
                                 _log_with_timestamp(f"[extract] ⏸ Pausing for {rate_limit_pause}s to avoid further rate limiting...")
                                 time.sleep(rate_limit_pause)
                                 # Clear old timestamps after pause
-                                logger.unavailable_timestamps = []
+                                logger.unavailable_timestamps.clear()
 
                             # Check if we should rotate client due to too many unavailable errors
                             if consecutive_unavailable_errors >= unavailable_error_threshold:
@@ -32,9 +32,13 @@ USER_AGENTS = [
 ]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DownloadAttempt:
-    """Tracks the state of a download attempt."""
+    """Tracks the state of a download attempt.
+
+    Built once per attempt and only ever read afterwards, so frozen with
+    slots: no per-instance __dict__ and attribute reads are slot fetches.
+    """
     downloaded: int
     video_unavailable_errors: int
     other_errors: int
@@ -103,7 +107,22 @@ def normalize_url(url: str) -> str:
     return cleaned.rstrip("/")
 
 
-@dataclass(frozen=True)
+_TRAILING_TAB_RE = re.compile(r"/(videos|shorts|streams|live)$")
+
+# Suffixes appended to the base channel URL, keyed on (trailing tab in the
+# input URL or None, include_shorts); precomputed so build_download_urls is
+# one regex match plus a table lookup instead of conditional appends.
+_CHANNEL_TAB_SUFFIXES: Dict[Tuple[Optional[str], bool], Tuple[str, ...]] = {}
+for _tab in (None, "videos", "shorts", "streams", "live"):
+    _primary = f"/{_tab}" if _tab else "/videos"
+    _CHANNEL_TAB_SUFFIXES[(_tab, False)] = (_primary,)
+    _CHANNEL_TAB_SUFFIXES[(_tab, True)] = (
+        (_primary,) if _primary == "/shorts" else (_primary, "/shorts")
+    )
+del _tab, _primary
+
+
+@dataclass(frozen=True, slots=True)
 class Source:
     """Represents a YouTube source (channel, playlist, or video)."""
     kind: SourceType
@@ -114,21 +133,11 @@ class Source:
         normalized = normalize_url(self.url)
 
         if self.kind is SourceType.CHANNEL:
-            urls: List[str]
-            base_channel_url = normalized
-            trailing_match = re.search(r"/(videos|shorts|streams|live)$", normalized)
-
-            if trailing_match:
-                urls = [normalized]
-                base_channel_url = normalized[: -len(trailing_match.group(0))]
-            else:
-                urls = [normalized + "/videos"]
-
-            if include_shorts:
-                shorts_url = base_channel_url + "/shorts"
-                if shorts_url not in urls:
-                    urls.append(shorts_url)
-            return urls
+            match = _TRAILING_TAB_RE.search(normalized)
+            tab = match.group(1) if match else None
+            base = normalized[: match.start()] if match else normalized
+            suffixes = _CHANNEL_TAB_SUFFIXES[(tab, include_shorts)]
+            return [base + suffix for suffix in suffixes]
 
         return [normalized]
 
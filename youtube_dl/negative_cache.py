@@ -0,0 +1,114 @@
+"""Negative cache of video ids known to be permanently unavailable."""
+
+import json
+import os
+import sys
+import time
+from typing import Dict, Optional
+
+# Categories from classify_error that never recover versus those that often
+# clear up on their own (generic unavailability is frequently rate limiting
+# or bot detection rather than a truly dead video).
+PERMANENT_CATEGORIES = frozenset({"private_deleted"})
+TEMPORARY_CATEGORIES = frozenset({"video_unavailable"})
+
+# How long a temporary entry keeps a video out of retries.
+TEMPORARY_TTL = 24 * 60 * 60.0  # seconds
+
+
+class NegativeCache:
+    """Tracks dead video ids so repeat runs stop re-requesting them.
+
+    Persisted as JSON under the output directory; permanently dead ids
+    (private/deleted/removed) never expire, generically unavailable ids
+    expire after TEMPORARY_TTL. Membership follows skip semantics:
+    permanent marks apply immediately, but temporary marks recorded during
+    the current run are only persisted for future runs — within a run the
+    client-rotation logic exists precisely to retry generically
+    unavailable videos with a different client.
+    """
+
+    FILENAME = ".unavailable_videos.json"
+
+    def __init__(self, output_root: Optional[str]) -> None:
+        self._path = (
+            os.path.join(output_root, self.FILENAME) if output_root else None
+        )
+        # video_id -> {"reason": str, "expires_at": Optional[float]}
+        self._entries: Dict[str, dict] = {}
+        self._dirty = False
+        self._load()
+        # Ids present on disk before this run; temporary marks added later
+        # are excluded from membership until a future run reloads them.
+        self._loaded_ids = frozenset(self._entries)
+
+    def _load(self) -> None:
+        if not self._path:
+            return
+        try:
+            with open(self._path, "r", encoding="utf-8") as handle:
+                raw = json.load(handle)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            print(
+                f"Warning: could not read negative cache {self._path}: {exc}",
+                file=sys.stderr,
+            )
+            return
+        if not isinstance(raw, dict):
+            return
+        now = time.time()
+        for video_id, entry in raw.items():
+            if not isinstance(entry, dict):
+                continue
+            expires_at = entry.get("expires_at")
+            if expires_at is not None and expires_at <= now:
+                self._dirty = True  # drop expired entries on next save
+                continue
+            self._entries[str(video_id)] = entry
+
+    def __contains__(self, video_id: str) -> bool:
+        entry = self._entries.get(video_id)
+        if entry is None:
+            return False
+        expires_at = entry.get("expires_at")
+        if expires_at is None:
+            return True
+        if expires_at <= time.time():
+            del self._entries[video_id]
+            self._dirty = True
+            return False
+        return video_id in self._loaded_ids
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def mark(self, video_id: str, category: str) -> None:
+        """Record *video_id* as dead if *category* warrants it."""
+        if video_id in self._entries:
+            return
+        if category in PERMANENT_CATEGORIES:
+            expires_at = None
+        elif category in TEMPORARY_CATEGORIES:
+            expires_at = time.time() + TEMPORARY_TTL
+        else:
+            return
+        self._entries[video_id] = {"reason": category, "expires_at": expires_at}
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty or not self._path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            tmp_path = f"{self._path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(self._entries, handle, indent=2, sort_keys=True)
+            os.replace(tmp_path, self._path)
+            self._dirty = False
+        except OSError as exc:
+            print(
+                f"Warning: could not write negative cache {self._path}: {exc}",
+                file=sys.stderr,
+            )
@@ -1,5 +1,6 @@
 """Source URL parsing and loading functionality."""
 
+import functools
 import random
 import re
 import sys
@@ -13,6 +14,42 @@ from .errors import RemoteSourceError
 from .models import Source, SourceType, normalize_url
 
 
+PLAYLIST_PATH_INDICATORS = (
+    "/playlist",
+    "/playlists",
+    "/watchlist",
+)
+
+VIDEO_PATH_PREFIXES = (
+    "/watch",
+    "/shorts/",
+    "/live/",
+    "/clip/",
+    "/v/",
+)
+
+CHANNEL_PATH_PREFIXES = (
+    "/@",
+    "/channel/",
+    "/c/",
+    "/user/",
+)
+
+# The prefix tuples above stay the source of truth; each is compiled into
+# one alternation so classifying a path is a single regex scan instead of
+# a Python-level loop of substring checks. Playlist indicators may appear
+# anywhere in the path (e.g. /@handle/playlists), the other two are
+# anchored prefixes.
+# An inline comment starts at "#" preceded by whitespace, which naturally
+# leaves URL fragments like ...#frag intact. Compiled once so stripping is
+# a single search without a per-call regex-cache lookup.
+_INLINE_COMMENT_RE = re.compile(r"\s#")
+
+_PLAYLIST_PATH_RE = re.compile("|".join(map(re.escape, PLAYLIST_PATH_INDICATORS)))
+_VIDEO_PATH_RE = re.compile("|".join(map(re.escape, VIDEO_PATH_PREFIXES)))
+_CHANNEL_PATH_RE = re.compile("|".join(map(re.escape, CHANNEL_PATH_PREFIXES)))
+
+
 def infer_source_kind(url: str) -> SourceType:
     """Best-effort inference for the source type based on the URL structure."""
 
@@ -35,43 +72,31 @@ def infer_source_kind(url: str) -> SourceType:
 
     lowered_path = path.lower()
 
-    playlist_indicators = (
-        "/playlist",
-        "/playlists",
-        "/watchlist",
-    )
-    if any(indicator in lowered_path for indicator in playlist_indicators):
+    if _PLAYLIST_PATH_RE.search(lowered_path):
         return SourceType.PLAYLIST
 
-    video_prefixes = (
-        "/watch",
-        "/shorts/",
-        "/live/",
-        "/clip/",
-        "/v/",
-    )
-    if any(lowered_path.startswith(prefix) for prefix in video_prefixes):
+    if _VIDEO_PATH_RE.match(lowered_path):
         return SourceType.VIDEO
 
-    channel_prefixes = (
-        "/@",
-        "/channel/",
-        "/c/",
-        "/user/",
-    )
-    if any(lowered_path.startswith(prefix) for prefix in channel_prefixes):
+    if _CHANNEL_PATH_RE.match(lowered_path):
         return SourceType.CHANNEL
 
     return SourceType.CHANNEL
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_source_line(line: str) -> Optional[Source]:
-    """Parse a line from a channels file into a Source object."""
+    """Parse a line from a channels file into a Source object.
+
+    Memoized: the same line shows up again on watch-loop reloads and
+    remote-list retries, and Source is frozen so cached instances are
+    safe to share. Raising (e.g. a prefix with no URL) skips the cache.
+    """
     stripped = line.strip()
     if not stripped or stripped.startswith("#"):
         return None
 
-    comment_match = re.search(r"\s#", stripped)
+    comment_match = _INLINE_COMMENT_RE.search(stripped)
     if comment_match:
         stripped = stripped[: comment_match.start()].rstrip()
         if not stripped:
@@ -100,6 +125,11 @@ def parse_source_line(line: str) -> Optional[Source]:
     return Source(inferred_kind, stripped)
 
 
+# Refuse remote source lists larger than this; a well-formed channels file is
+# at most a few hundred KiB, so anything bigger is a misconfigured URL.
+MAX_REMOTE_SOURCE_BYTES = 16 * 1024 * 1024
+
+
 def load_sources_from_url(url: str) -> Tuple[List[Source], List[str]]:
     """Load sources from a remote URL with retry logic."""
     print(f"\nFetching source list from {url} ...")
@@ -108,10 +138,36 @@ def load_sources_from_url(url: str) -> Tuple[List[Source], List[str]]:
     max_retries = 4
     base_delay = 2.0
 
+    sources: List[Source] = []
+    raw_lines: List[str] = []
+
     for attempt in range(max_retries):
+        # Read the whole body in one kernel->user copy and split it in C;
+        # a retry starts the parse over from scratch.
+        sources.clear()
+        raw_lines.clear()
         try:
             with urllib.request.urlopen(url, timeout=30) as response:
-                data = response.read().decode("utf-8")
+                data = response.read(MAX_REMOTE_SOURCE_BYTES + 1)
+            if len(data) > MAX_REMOTE_SOURCE_BYTES:
+                raise RemoteSourceError(
+                    f"Source list from {url} exceeds {MAX_REMOTE_SOURCE_BYTES} bytes; refusing to parse"
+                )
+            for idx, line in enumerate(data.decode("utf-8", "replace").splitlines(), start=1):
+                stripped = line.strip()
+                if not stripped or stripped.startswith("#"):
+                    continue
+                try:
+                    parsed = parse_source_line(stripped)
+                except ValueError as exc:
+                    raise RemoteSourceError(
+                        f"Failed to parse line {idx} from {url}: {exc}"
+                    ) from exc
+                if parsed:
+                    sources.append(parsed)
+                    # Interned: the same lines recur across scan iterations
+                    # and state-file diffs, so set lookups compare pointers
+                    raw_lines.append(sys.intern(stripped))
             break  # Success, exit retry loop
         except (urllib.error.HTTPError, urllib.error.URLError) as exc:
             if attempt < max_retries - 1:
@@ -121,22 +177,6 @@ def load_sources_from_url(url: str) -> Tuple[List[Source], List[str]]:
             else:
                 raise RemoteSourceError(f"Failed to fetch source list from {url} after {max_retries} attempts: {exc}") from exc
 
-    sources: List[Source] = []
-    raw_lines: List[str] = []
-    for idx, line in enumerate(data.splitlines(), start=1):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        try:
-            parsed = parse_source_line(stripped)
-        except ValueError as exc:
-            raise RemoteSourceError(
-                f"Failed to parse line {idx} from {url}: {exc}"
-            ) from exc
-        if parsed:
-            sources.append(parsed)
-            raw_lines.append(stripped)
-
     # Randomize the order of sources
     if sources:
         combined = list(zip(sources, raw_lines))
@@ -164,7 +204,7 @@ def load_sources_from_file(path: str) -> Tuple[List[Source], List[str]]:
                 raise ValueError(f"{path}:{idx}: {exc}") from exc
             if parsed:
                 sources.append(parsed)
-                raw_lines.append(stripped)
+                raw_lines.append(sys.intern(stripped))
 
     # Randomize the order of sources
     if sources:
@@ -72,14 +72,16 @@ def select_random_user_agent() -> str:
 
 def load_proxies_from_file(proxy_file: str) -> List[str]:
     """Load proxy URLs from a file, one per line."""
-    proxies: List[str] = []
     try:
         with open(proxy_file, "r", encoding="utf-8") as f:
-            for line in f:
-                stripped = line.strip()
-                # Skip empty lines and comments
-                if stripped and not stripped.startswith("#"):
-                    proxies.append(stripped)
+            content = f.read()
+        # One read + C-level splitlines instead of per-line iteration;
+        # skip empty lines and comments
+        proxies = [
+            stripped
+            for line in content.splitlines()
+            if (stripped := line.strip()) and not stripped.startswith("#")
+        ]
         if proxies:
             print(f"Loaded {len(proxies)} proxies from {proxy_file}")
         else:
@@ -113,25 +115,21 @@ def select_proxy(args) -> Optional[str]:
     return None
 
 
-def build_ydl_options(
-    args,
-    player_client: Optional[str],
-    logger: DownloadLogger,
-    hook,
-    additional_filters: Optional[Iterable[Callable[[dict], Optional[str]]]] = None,
-) -> dict:
-    """Build yt-dlp options dictionary based on arguments."""
+def _build_stable_ydl_options(args, player_client: Optional[str]) -> tuple:
+    """Build the deterministic portion of the yt-dlp options.
+
+    Everything here depends only on the args namespace and the player
+    client, so build_ydl_options caches the result per client (on the args
+    namespace, like the proxy pool) instead of rebuilding it for every
+    retry attempt. The per-attempt pieces — logger, progress hook, rotated
+    User-Agent, proxy choice and extra match filters — are layered on top
+    of a shallow copy by build_ydl_options.
+    """
     outtmpl = os.path.join(
         args.output,
         "%(channel)s/%(upload_date>%Y-%m-%d)s - %(title).200B [%(id)s].%(ext)s",
     )
 
-    # Rotate User-Agent to appear as different browsers
-    user_agent = select_random_user_agent()
-
-    # Select proxy if configured
-    proxy = select_proxy(args)
-
     ydl_opts = {
         "continuedl": True,
         "ignoreerrors": "only_download",
@@ -148,17 +146,8 @@ def build_ydl_options(
         "download_archive": args.archive,
         "quiet": False,
         "no_warnings": False,
-        "logger": logger,
-        "progress_hooks": [hook],
-        "http_headers": {
-            "User-Agent": user_agent,
-        },
     }
 
-    # Add proxy if configured
-    if proxy:
-        ydl_opts["proxy"] = proxy
-
     format_selection = select_format_for_client(args, player_client)
     format_selector = format_selection.effective
     requested_format = format_selection.requested
@@ -233,16 +222,20 @@ def build_ydl_options(
         filters.append(restricted_match_filter)
 
     extractor_args: Dict[str, Dict[str, List[str]]] = {}
-    youtube_extractor_args: Dict[str, List[str]] = {}
 
-    if player_client:
-        youtube_extractor_args["player_client"] = [player_client]
-    if args.youtube_fetch_po_token:
-        youtube_extractor_args["fetch_po_token"] = [args.youtube_fetch_po_token]
-    if args.youtube_po_token:
-        youtube_extractor_args["po_token"] = list(args.youtube_po_token)
-    if args.youtube_player_params:
-        youtube_extractor_args["player_params"] = [args.youtube_player_params]
+    # Build the youtube extractor args in one comprehension over a static
+    # key/value table instead of four conditional inserts; po_token is
+    # already a list and gets copied, scalar values are wrapped.
+    youtube_extractor_args: Dict[str, List[str]] = {
+        key: list(value) if isinstance(value, list) else [value]
+        for key, value in (
+            ("player_client", player_client),
+            ("fetch_po_token", args.youtube_fetch_po_token),
+            ("po_token", args.youtube_po_token),
+            ("player_params", args.youtube_player_params),
+        )
+        if value
+    }
 
     if youtube_extractor_args:
         extractor_args["youtube"] = youtube_extractor_args
@@ -267,13 +260,6 @@ def build_ydl_options(
     if extractor_args:
         ydl_opts["extractor_args"] = extractor_args
 
-    if additional_filters:
-        filters.extend(additional_filters)
-
-    combined_filter = _combine_match_filters(filters)
-    if combined_filter:
-        ydl_opts["match_filter"] = combined_filter
-
     if format_selector:
         debug_format = f"format={format_selector}"
         if requested_format and requested_format != format_selector:
@@ -329,6 +315,52 @@ def build_ydl_options(
             )
         )
 
+    return ydl_opts, filters, debug_parts
+
+
+def build_ydl_options(
+    args,
+    player_client: Optional[str],
+    logger: DownloadLogger,
+    hook,
+    additional_filters: Optional[Iterable[Callable[[dict], Optional[str]]]] = None,
+) -> dict:
+    """Build yt-dlp options dictionary based on arguments."""
+    cache: Optional[Dict[Optional[str], tuple]] = getattr(
+        args, "_stable_ydl_opts", None
+    )
+    if cache is None:
+        cache = {}
+        args._stable_ydl_opts = cache
+    cached = cache.get(player_client)
+    if cached is None:
+        cached = _build_stable_ydl_options(args, player_client)
+        cache[player_client] = cached
+    stable_opts, stable_filters, stable_debug = cached
+
+    ydl_opts = dict(stable_opts)
+    ydl_opts["logger"] = logger
+    ydl_opts["progress_hooks"] = [hook]
+
+    # Rotate User-Agent to appear as different browsers
+    user_agent = select_random_user_agent()
+    ydl_opts["http_headers"] = {"User-Agent": user_agent}
+
+    # Select proxy if configured
+    proxy = select_proxy(args)
+    if proxy:
+        ydl_opts["proxy"] = proxy
+
+    filters = list(stable_filters)
+    if additional_filters:
+        filters.extend(additional_filters)
+
+    combined_filter = _combine_match_filters(filters)
+    if combined_filter:
+        ydl_opts["match_filter"] = combined_filter
+
+    debug_parts = list(stable_debug)
+
     # Add user agent info to debug output
     user_agent_short = user_agent.split('(')[0].strip() if '(' in user_agent else user_agent[:50]
     debug_parts.append(f"user_agent={user_agent_short}")